@@ -1,5 +1,8 @@
+import hashlib
+
 import pandas as pd
 import numpy as np
+import plotly.express as px
 import streamlit as st
 
 # 관리자 임의 데이터--------------------------------------------
@@ -104,6 +107,96 @@ def service_management():
     st.markdown("### 🤖 챗봇 모델 선택")
     selected_model = st.selectbox("사용할 챗봇 모델을 선택하세요", ["v1.0", "v1.5", "v2.0", "GPT-4"])
 
+    st.markdown("### 🚦 감정 분석 모드")
+    from emotion_fallback import get_degradation_controller, FALLBACK
+    mode_stats = get_degradation_controller().stats()
+    if mode_stats["mode"] == FALLBACK:
+        st.warning("⚡ 경량 모드: 요청이 몰려 문자 n-gram 분류기로 응답 중입니다.")
+    else:
+        st.success("✅ 정상 모드: KoELECTRA 모델로 감정을 분석 중입니다.")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("평균 대기 시간", f"{mode_stats['wait_ewma_ms']:.0f}ms", f"예산 {mode_stats['budget_ms']:.0f}ms", delta_color="off")
+    col2.metric("모드 전환 횟수", mode_stats["switches"])
+    col3.metric("경량 모드 응답", mode_stats["fallback_requests"])
+    col4.metric("경량 모델", "준비됨" if mode_stats["fallback_available"] else "없음")
+
+    st.markdown("### 🚥 상담 요청 대기열")
+    from llm_limiter import get_llm_limiter
+    limiter_stats = get_llm_limiter().stats()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("대기 중", f"{limiter_stats['waiting']} / {limiter_stats['max_queue']}")
+    col2.metric("통과", limiter_stats["admitted"])
+    col3.metric("거절(대기열 가득)", limiter_stats["rejected"])
+    col4.metric("429 재시도", limiter_stats["retries"])
+    st.caption(f"초당 {limiter_stats['rate_per_sec']:g}건 제한, 남은 토큰 {limiter_stats['tokens']:.1f}개")
+
+    st.markdown("### ⏱️ 대화 단계별 지연시간")
+    from chat_metrics import STAGES, WINDOW_SECONDS, get_chat_metrics
+    stage_stats = get_chat_metrics().stats()
+    if stage_stats["total"]["count"]:
+        st.dataframe(pd.DataFrame(
+            [
+                {
+                    "단계": label,
+                    "횟수": stage_stats[stage]["count"],
+                    "p50 (ms)": stage_stats[stage]["p50_ms"],
+                    "p95 (ms)": stage_stats[stage]["p95_ms"],
+                }
+                for stage, label in STAGES.items()
+            ]
+        ).round(0))
+    else:
+        st.info("아직 기록된 상담 요청이 없습니다.")
+    st.caption(f"최근 {WINDOW_SECONDS // 60}분 기준")
+
+    st.markdown("### 🔌 OpenAI 연결")
+    from llm_client import get_connection_stats
+    conn_stats = get_connection_stats().stats()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("요청 수", conn_stats["requests"])
+    col2.metric("연결 재사용률", f"{conn_stats['reuse_rate'] * 100:.1f}%")
+    col3.metric("새 연결", conn_stats["new_connections"])
+    col4.metric("TLS 핸드셰이크", conn_stats["tls_handshakes"])
+
+    st.markdown("### 💾 상담 답변 캐시")
+    from reply_cache import get_reply_cache
+    reply_stats = get_reply_cache().stats()
+    if not reply_stats["enabled"]:
+        st.info("답변 캐시가 꺼져 있습니다. REPLY_CACHE_ENABLED=1 로 켤 수 있습니다.")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("적중률", f"{reply_stats['hit_rate'] * 100:.1f}%")
+    col2.metric("적중 / 미적중", f"{reply_stats['hits']} / {reply_stats['misses']}")
+    col3.metric("저장된 답변", f"{reply_stats['entries']} / {reply_stats['max_entries']}")
+    top_replies = get_reply_cache().top_keys()
+    if top_replies:
+        # 상담 입력 원문은 보여 주지 않고 구분용 짧은 해시만 보여 준다
+        st.dataframe(pd.DataFrame(
+            [
+                {
+                    "입력 (해시)": hashlib.sha256(key.encode("utf-8")).hexdigest()[:10],
+                    "감정": key.split("|", 2)[0],
+                    "신뢰도 구간": key.split("|", 2)[1],
+                    "적중 횟수": hits,
+                    "저장 시각": pd.to_datetime(created_at, unit="s"),
+                }
+                for key, hits, created_at, _ in top_replies
+            ]
+        ))
+
+    st.markdown("### 🧠 감정 분석 캐시")
+    from emotion_cache import get_emotion_cache
+    cache_stats = get_emotion_cache().stats()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("적중률", f"{cache_stats['hit_rate'] * 100:.1f}%")
+    col2.metric("메모리 적중", cache_stats["memory_hits"])
+    col3.metric("디스크 적중", cache_stats["disk_hits"])
+    col4.metric("미적중", cache_stats["misses"])
+    st.caption(
+        f"메모리 {cache_stats['memory_entries']} / {cache_stats['memory_capacity']}개, "
+        f"디스크 {cache_stats['disk_entries']} / {cache_stats['disk_capacity']}개 저장됨 "
+        f"(보관 {cache_stats['ttl_seconds'] / 86400:g}일)"
+    )
+
 def money_management():
     st.subheader("💰 수익 관리")
 
@@ -1,24 +1,9 @@
-import os
-import folium
-import numpy as np
-import pandas as pd
-from PIL import Image
 import streamlit as st
-from openai import OpenAI
-import plotly.express as px
-from dotenv import load_dotenv
-import plotly.graph_objects as go
-from geopy.geocoders import Nominatim
-from streamlit_folium import st_folium
-from datetime import datetime, timedelta
-from streamlit_option_menu import option_menu
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
 
 # 파이썬 라이브러리 가지고오기 ----------------------------------
+# 각 페이지의 무거운 라이브러리(transformers, torch, folium, plotly 등)는
+# 해당 페이지를 처음 열 때만 import 한다
 from login_logout import login, logout
-from user import my_dashboard, chat_bot, hospital, content
-from admin import user_management, evaluation, service_management, money_management
-from unuser import u_my_dashboard
 
 # 페이지 기본 설정
 st.set_page_config(page_title="츄러스미 심리케어",layout='wide')
@@ -28,94 +13,94 @@ if "logged_in" not in st.session_state:
     st.session_state.logged_in = False
     st.session_state.username = ""
     st.session_state.role = ""
-    
+
+# 페이지 함수 (지연 import) ------------------------------------------
+def my_dashboard_page():
+    from user import my_dashboard
+    my_dashboard()
+
+def u_my_dashboard_page():
+    from unuser import u_my_dashboard
+    u_my_dashboard()
+
+def chat_bot_page():
+    from user import chat_bot
+    chat_bot()
+
+def hospital_page():
+    from user import hospital
+    hospital()
+
+def content_page():
+    from user import content
+    content()
+
+def user_management_page():
+    from admin import user_management
+    user_management()
+
+def evaluation_page():
+    from admin import evaluation
+    evaluation()
+
+def service_management_page():
+    from admin import service_management
+    service_management()
+
+def money_management_page():
+    from admin import money_management
+    money_management()
+
+def start_model_warmup():
+    # 대화 페이지가 있는 역할만 감정 분석 모델을 백그라운드로 미리 올린다
+    from emotion_model import get_emotion_model
+    get_emotion_model()
+
 # 회원 페이지 설정 --------------------------------------------------------
 def user_dashboard():
-    # 사이드바 메뉴
-    with st.sidebar:
-        selected = option_menu(
-            "츄러스미 메뉴",
-            ["나의 대시보드", "심린이랑 대화하기", "심린이 추천병원", "심린이 추천 콘텐츠", "로그아웃"],
-            icons=['bar-chart', 'chat-dots', 'hospital', 'camera-video', 'box-arrow-right'],
-            default_index=0,
-            styles={
-                "container": {"padding": "5px"},
-                "nav-link": {"font-size": "16px", "text-align": "left", "margin":"0px", "--hover-color": "#eee"},
-                "nav-link-selected": {"background-color": "#b3d9ff"},
-            }
-        )
-    if selected == '나의 대시보드':
-        my_dashboard()
-    elif selected == '심린이랑 대화하기':
-        chat_bot()
-    elif selected == '심린이 추천병원':
-        hospital()
-    elif selected == '심린이 추천 콘텐츠':
-        content()
-    else:
-        logout()
+    start_model_warmup()
+    return [
+        st.Page(my_dashboard_page, title="나의 대시보드", icon="📊", url_path="dashboard", default=True),
+        st.Page(chat_bot_page, title="심린이랑 대화하기", icon="💬", url_path="chat"),
+        st.Page(hospital_page, title="심린이 추천병원", icon="🏥", url_path="hospital"),
+        st.Page(content_page, title="심린이 추천 콘텐츠", icon="🎬", url_path="content"),
+        st.Page(logout, title="로그아웃", icon="🚪", url_path="logout"),
+    ]
 
 
 # 비회원 페이지 설정 -----------------------------------------------------
 def unuser_dashboard():
-    # 사이드바 메뉴
-    with st.sidebar:
-        selected = option_menu(
-            "츄러스미 메뉴",
-            ["나의 대시보드", "심린이랑 대화하기", "심린이 추천병원", "심린이 추천 콘텐츠", "로그아웃"],
-            icons=['bar-chart', 'chat-dots', 'hospital', 'camera-video', 'box-arrow-right'],
-            default_index=0,
-            styles={
-                "container": {"padding": "5px"},
-                "nav-link": {"font-size": "16px", "text-align": "left", "margin":"0px", "--hover-color": "#eee"},
-                "nav-link-selected": {"background-color": "#b3d9ff"},
-            }
-        )
-      
-    if selected == '나의 대시보드':
-        u_my_dashboard()
-    elif selected == '심린이랑 대화하기':
-        chat_bot()
-    elif selected == '심린이 추천병원':
-        hospital()
-    elif selected == '심린이 추천 콘텐츠':
-        content()
-    else:
-        logout()
+    start_model_warmup()
+    return [
+        st.Page(u_my_dashboard_page, title="나의 대시보드", icon="📊", url_path="dashboard", default=True),
+        st.Page(chat_bot_page, title="심린이랑 대화하기", icon="💬", url_path="chat"),
+        st.Page(hospital_page, title="심린이 추천병원", icon="🏥", url_path="hospital"),
+        st.Page(content_page, title="심린이 추천 콘텐츠", icon="🎬", url_path="content"),
+        st.Page(logout, title="로그아웃", icon="🚪", url_path="logout"),
+    ]
 
 
 # 관리자 페이지 설정 ---------------------------------------------------------
 def admin_dashboard():
     st.title("👮‍♂️ 츄러스미 관리자 Dash Board")
 
-    # 사이드바 메뉴
-    with st.sidebar:
-        admin_menu = option_menu(
-            "관리자 메뉴",
-            ["사용자 통계", "고객 평가", "서비스 설정", "수익 관리", "로그아웃"],
-            icons=["bar-chart-line", "chat-dots", "gear", "currency-dollar", "box-arrow-right"],
-            menu_icon="gear",
-            default_index=0
-        )
-
-    if admin_menu == "사용자 통계":
-        user_management()
-    elif admin_menu == "고객 평가":
-        evaluation()
-    elif admin_menu == "서비스 설정":
-        service_management()
-    elif admin_menu == "수익 관리":
-        money_management()
-    else:
-        logout()
+    return [
+        st.Page(user_management_page, title="사용자 통계", icon="📈", url_path="users", default=True),
+        st.Page(evaluation_page, title="고객 평가", icon="⭐", url_path="evaluation"),
+        st.Page(service_management_page, title="서비스 설정", icon="⚙️", url_path="service"),
+        st.Page(money_management_page, title="수익 관리", icon="💰", url_path="money"),
+        st.Page(logout, title="로그아웃", icon="🚪", url_path="logout"),
+    ]
 
 # 앱 구동 ----------------------------------------------------------------
 if st.session_state.logged_in:
     if st.session_state.role == "admin":
-        admin_dashboard()
+        pages = admin_dashboard()
     elif st.session_state.role == "user":
-        user_dashboard()
+        pages = user_dashboard()
     else:
-        unuser_dashboard()
+        pages = unuser_dashboard()
 else:
-    login()
\ No newline at end of file
+    pages = [st.Page(login, title="로그인", icon="🔐", url_path="login", default=True)]
+
+st.navigation(pages, position="sidebar" if st.session_state.logged_in else "hidden").run()
\ No newline at end of file
@@ -0,0 +1,202 @@
+"""앱 시작 / 페이지별 렌더링 시간 벤치마크.
+
+Streamlit AppTest 로 앱을 화면 없이 돌리고(모델/LLM/지오코더는 가짜로 교체),
+모듈별 cold import 시간과 메뉴별 warm rerun 시간을 JSON 리포트로 남긴다.
+
+    python bench/bench_app.py --runs 20 --out bench_app.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# cold import 를 잴 모듈
+MODULES = ["login_logout", "emotion_model", "unuser", "admin", "user"]
+
+# (메뉴 이름, 모듈, 함수, 역할)
+PAGES = [
+    ("나의 대시보드", "user", "my_dashboard", "user"),
+    ("심린이랑 대화하기", "user", "chat_bot", "user"),
+    ("심린이 추천병원", "user", "hospital", "user"),
+    ("심린이 추천 콘텐츠", "user", "content", "user"),
+    ("비회원 대시보드", "unuser", "u_my_dashboard", "unuser"),
+    ("사용자 통계", "admin", "user_management", "admin"),
+    ("고객 평가", "admin", "evaluation", "admin"),
+    ("서비스 설정", "admin", "service_management", "admin"),
+    ("수익 관리", "admin", "money_management", "admin"),
+]
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * q / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(samples):
+    return {
+        "runs": len(samples),
+        "mean_ms": statistics.mean(samples) * 1000,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def max_rss_mb():
+    # 리눅스는 KB, macOS 는 byte 단위
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+# cold import 측정 (새 프로세스) ----------------------------------
+def cold_import(module):
+    code = (
+        "import time, json, sys\n"
+        f"sys.path.insert(0, {ROOT!r})\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - t\n"
+        "print(json.dumps({'seconds': elapsed, 'heavy': sorted(m for m in ('torch', 'transformers', 'folium', 'openai', 'plotly') if m in sys.modules)}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if out.returncode != 0:
+        return {"error": out.stderr.strip().splitlines()[-1] if out.stderr.strip() else "failed"}
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    return {"ms": result["seconds"] * 1000, "heavy_modules": result["heavy"]}
+
+
+# AppTest 로 화면 그리기 -------------------------------------------
+def page_script(module, func):
+    # AppTest.from_function 은 이 함수 본문만 스크립트로 실행한다
+    import importlib
+    getattr(importlib.import_module(module), func)()
+
+
+def new_app(role=None, module=None, func=None, timeout=30):
+    from streamlit.testing.v1 import AppTest
+
+    if module is None:
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=timeout)
+    else:
+        at = AppTest.from_function(page_script, args=(module, func), default_timeout=timeout)
+    at.secrets["OPENAI_API_KEY"] = "bench"
+    at.session_state["logged_in"] = role is not None
+    at.session_state["username"] = role or ""
+    at.session_state["role"] = role or ""
+    return at
+
+
+def time_runs(at, runs, action=None):
+    first_start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - first_start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        if action is not None:
+            action(at)
+        else:
+            at.run()
+        samples.append(time.perf_counter() - start)
+    return first, samples
+
+
+def bench_app_entry(name, role, runs):
+    at = new_app(role)
+    first, samples = time_runs(at, runs)
+    return {"name": name, "first_render_ms": first * 1000, "warm": summarize(samples)}
+
+
+def bench_page(name, module, func, role, runs):
+    at = new_app(role, module, func)
+    first, samples = time_runs(at, runs)
+    return {"name": name, "module": module, "function": func, "first_render_ms": first * 1000, "warm": summarize(samples)}
+
+
+def bench_chat_submit(runs):
+    from emotion_model import get_emotion_model
+
+    # 가짜 모델도 백그라운드로 올라가므로 준비될 때까지 기다린다
+    get_emotion_model().wait(10)
+    at = new_app("user", "user", "chat_bot")
+
+    def submit(at):
+        at.chat_input[0].set_value("요즘 너무 힘들어").run()
+
+    first, samples = time_runs(at, runs, submit)
+    return {"name": "대화 전송", "first_render_ms": first * 1000, "warm": summarize(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="츄러스미 앱 렌더링 벤치마크")
+    parser.add_argument("--runs", type=int, default=10, help="메뉴별 warm rerun 횟수")
+    parser.add_argument("--out", default="bench_app.json", help="JSON 리포트 경로")
+    parser.add_argument("--model-delay", type=float, default=0.0, help="가짜 분류기 지연(초)")
+    parser.add_argument("--llm-delay", type=float, default=0.0, help="가짜 LLM 지연(초)")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)  # 이미지 파일을 상대 경로로 연다
+    # 앱 모듈보다 먼저: 저장소는 임시 디렉터리로, 분류기는 가짜로 (cold import 자식 프로세스도 같은 환경을 받는다)
+    from stubs import install_stubs
+    install_stubs(model_delay=args.model_delay, llm_delay=args.llm_delay)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "cold_import": {module: cold_import(module) for module in MODULES},
+    }
+
+    report["app"] = [
+        bench_app_entry("로그인", None, args.runs),
+        bench_app_entry("관리자 첫 화면", "admin", args.runs),
+        bench_app_entry("회원 첫 화면", "user", args.runs),
+    ]
+    report["pages"] = []
+    for name, module, func, role in PAGES:
+        try:
+            report["pages"].append(bench_page(name, module, func, role, args.runs))
+        except Exception as e:
+            report["pages"].append({"name": name, "module": module, "function": func, "error": str(e)})
+    report["chat"] = bench_chat_submit(args.runs)
+    report["max_rss_mb"] = max_rss_mb()
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for entry in report["app"] + report["pages"] + [report["chat"]]:
+        if "error" in entry:
+            print(f"{entry['name']:<16} 오류: {entry['error']}")
+        else:
+            print(f"{entry['name']:<16} first {entry['first_render_ms']:8.1f}ms  "
+                  f"p50 {entry['warm']['p50_ms']:8.1f}ms  p95 {entry['warm']['p95_ms']:8.1f}ms")
+    print(f"리포트 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
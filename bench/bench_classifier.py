@@ -0,0 +1,195 @@
+"""감정 분류 백엔드 벤치마크 (지연시간 / 처리량 / 메모리 / 정확도 drift).
+
+백엔드마다 새 프로세스를 띄워 로딩 시간과 최대 RSS 를 따로 재고,
+배치 크기(1~64) x 시퀀스 길이(16~512 토큰) 조합마다 배치 지연시간 p50/p95/p99 와
+초당 처리 문장 수를 측정한다. 고정된 한국어 문장 모음의 분류 결과를
+fp32 torch 기준과 비교해 속도를 얻는 대신 정확도를 잃지 않았는지 확인한다.
+
+    python bench/bench_classifier.py --backends torch int8 onnx onnx-int8 --out bench_classifier.json
+    python bench/bench_classifier.py --batch-sizes 1 8 32 --seq-lens 32 128 --iters 10
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus_ko.txt")
+BATCH_SIZES = [1, 2, 4, 8, 16, 32, 64]
+SEQ_LENS = [16, 32, 64, 128, 256, 512]
+
+
+def load_corpus(path=CORPUS_PATH):
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * q / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def max_rss_mb():
+    # 리눅스는 KB, macOS 는 byte 단위
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def as_dict(scores):
+    return {item["label"]: item["score"] for item in scores}
+
+
+def drift(baseline, results):
+    # 기준(fp32) 대비 최고 감정 일치율과 점수 절대오차
+    agree, diffs = 0, []
+    for base, other in zip(baseline, results):
+        base, other = as_dict(base), as_dict(other)
+        agree += max(base, key=base.get) == max(other, key=other.get)
+        diffs.extend(abs(base[label] - other.get(label, 0.0)) for label in base)
+    return {
+        "top1_agreement": agree / len(baseline),
+        "mean_abs_score_diff": statistics.mean(diffs),
+        "max_abs_score_diff": max(diffs),
+    }
+
+
+def long_texts(corpus, count):
+    # 문장 모음을 이어 붙여 최대 길이(512 토큰)를 넘는 입력을 만들고, 시작 위치를 바꿔 서로 다르게 한다
+    joined = " ".join(corpus)
+    while len(joined) < 4000:
+        joined = joined + " " + joined
+    return [joined[(i * 97) % 1000:] for i in range(count)]
+
+
+# 백엔드 하나 측정 (자식 프로세스) ------------------------------------
+def run_backend(name, batch_sizes, seq_lens, iters):
+    from emotion_model import MODEL_NAME
+    from emotion_backends import load_backend
+
+    corpus = load_corpus()
+    start = time.perf_counter()
+    classifier = load_backend(MODEL_NAME, name)
+    load_seconds = time.perf_counter() - start
+    rss_after_load = max_rss_mb()
+
+    # 정확도 비교용: 문장 하나씩 원래 길이로 분류
+    predictions = [classifier(text)[0] for text in corpus]
+
+    grid = []
+    texts = long_texts(corpus, max(batch_sizes))
+    for seq_len in seq_lens:
+        for batch_size in batch_sizes:
+            batch = texts[:batch_size]
+            kwargs = {"batch_size": batch_size, "truncation": True, "max_length": seq_len}
+            classifier(batch, **kwargs)  # 워밍업
+            samples = []
+            for _ in range(iters):
+                t = time.perf_counter()
+                classifier(batch, **kwargs)
+                samples.append(time.perf_counter() - t)
+            grid.append({
+                "batch_size": batch_size,
+                "seq_len": seq_len,
+                "p50_ms": percentile(samples, 50) * 1000,
+                "p95_ms": percentile(samples, 95) * 1000,
+                "p99_ms": percentile(samples, 99) * 1000,
+                "seqs_per_sec": batch_size * len(samples) / sum(samples),
+            })
+            print(f"  {name:<10} bs={batch_size:<3} len={seq_len:<4} "
+                  f"p50 {grid[-1]['p50_ms']:8.1f}ms  {grid[-1]['seqs_per_sec']:8.1f} seq/s", file=sys.stderr)
+
+    return {
+        "backend": name,
+        "load_seconds": load_seconds,
+        "rss_after_load_mb": rss_after_load,
+        "peak_rss_mb": max_rss_mb(),
+        "grid": grid,
+        "predictions": predictions,
+    }
+
+
+def run_child(name, args):
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child", name,
+        "--iters", str(args.iters),
+        "--batch-sizes", *map(str, args.batch_sizes),
+        "--seq-lens", *map(str, args.seq_lens),
+    ]
+    out = subprocess.run(command, cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"exit {out.returncode}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감정 분류 백엔드 벤치마크")
+    parser.add_argument("--backends", nargs="+", default=["torch", "int8", "onnx", "onnx-int8"])
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=BATCH_SIZES)
+    parser.add_argument("--seq-lens", nargs="+", type=int, default=SEQ_LENS)
+    parser.add_argument("--iters", type=int, default=10, help="조합별 반복 횟수")
+    parser.add_argument("--out", default="bench_classifier.json", help="JSON 리포트 경로")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_backend(args.child, args.batch_sizes, args.seq_lens, args.iters), ensure_ascii=False))
+        return
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "corpus_size": len(load_corpus()),
+        "batch_sizes": args.batch_sizes,
+        "seq_lens": args.seq_lens,
+        "iters": args.iters,
+        "backends": [],
+    }
+
+    # fp32 torch 를 항상 먼저 돌려 기준값으로 쓴다
+    baseline = None
+    names = ["torch"] + [name for name in args.backends if name != "torch"]
+    for name in names:
+        try:
+            entry = run_child(name, args)
+        except Exception as e:
+            report["backends"].append({"backend": name, "error": str(e)})
+            print(f"{name:<10} 오류: {e}")
+            continue
+
+        predictions = entry.pop("predictions")
+        if name == "torch":
+            baseline = predictions
+        # fp32 기준이 실패했으면 다른 백엔드를 기준으로 삼지 않고 오차는 비워 둔다
+        if baseline is not None:
+            entry.update(drift(baseline, predictions))
+        report["backends"].append(entry)
+
+        best = max(entry["grid"], key=lambda row: row["seqs_per_sec"])
+        accuracy = (
+            f"top1 {entry['top1_agreement']:.3f}  |Δ| {entry['mean_abs_score_diff']:.4f}"
+            if baseline is not None else "fp32 기준 없음 (오차 생략)"
+        )
+        print(f"{name:<10} load {entry['load_seconds']:6.1f}s  peak RSS {entry['peak_rss_mb']:7.0f}MB  "
+              f"best {best['seqs_per_sec']:7.1f} seq/s (bs={best['batch_size']}, len={best['seq_len']})  {accuracy}")
+
+    report["drift_baseline"] = "torch" if baseline is not None else None
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"리포트 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""병원 공간 인덱스 벤치마크 + 가짜 병원 데이터 생성기.
+
+지명 사전의 시/군/구, 읍/면/동 중심 주변에 가짜 병원을 흩뿌려 만든 뒤,
+k-최근접 / 반경 검색 지연시간을 전체 배열 haversine 계산과 비교하고 결과가 같은지 확인한다.
+
+    python bench/bench_clinics.py --clinics 50000 --queries 2000 --out bench_clinics.json
+    python bench/bench_clinics.py --clinics 1500 --write data/clinics_sample.csv \
+        --write-ratings data/clinic_ratings_sample.csv   # 내장 예시 데이터 다시 만들기
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from bench_app import percentile, git_commit  # noqa: E402
+
+NAME_WORDS = ["마음", "힐링", "숲", "봄", "온", "밝은", "하늘", "새싹", "우리", "연세", "365", "다온", "편안한", "햇살", "쉼"]
+NAME_KINDS = ["정신건강의학과의원", "정신건강의학과", "신경정신과의원", "마음클리닉"]
+
+
+def make_clinics(n, seed=0):
+    from gazetteer import Gazetteer
+
+    rng = random.Random(seed)
+    places = [place for place in Gazetteer().places if place.level >= 2]
+    # 동 단위 지명이 있는 곳(대도시)에 더 몰리도록 가중치를 준다
+    weights = [3 if place.level == 3 else 1 for place in places]
+    rows = []
+    for i, place in enumerate(rng.choices(places, weights=weights, k=n)):
+        parts = place.name.split(" ")
+        short = parts[-1][:-1] if len(parts[-1]) > 2 else parts[-1]  # "역삼동" -> "역삼", "중구" 는 그대로
+        spread = 0.01 if place.level == 3 else 0.04
+        rows.append({
+            "clinic_id": f"C{i:06d}",
+            "name": f"{short} {rng.choice(NAME_WORDS)}{rng.choice(NAME_KINDS)}",
+            "sido": parts[0],
+            "sigungu": parts[1],
+            "address": f"{place.name} {rng.randint(1, 999)}-{rng.randint(1, 30)}",
+            "phone": "",  # 실제 번호처럼 보이는 가짜 번호는 넣지 않는다
+            "latitude": round(place.latitude + rng.gauss(0, spread), 6),
+            "longitude": round(place.longitude + rng.gauss(0, spread), 6),
+        })
+    return pd.DataFrame(rows)
+
+
+def make_ratings(clinics, seed=0):
+    # 병원마다 숨은 "실제 품질"을 두고, 평가 수는 병원마다 크게 차이 나게 만든다
+    rng = random.Random(seed)
+    now = time.time()
+    rows = []
+    for clinic_id in clinics["clinic_id"]:
+        if rng.random() < 0.3:
+            continue
+        quality = rng.uniform(2.5, 4.8)
+        for _ in range(int(rng.expovariate(1 / 8)) + 1):
+            rows.append({
+                "clinic_id": clinic_id,
+                "user": f"user{rng.randint(1, 5000):04d}",
+                "rating": min(5, max(1, round(rng.gauss(quality, 0.8)))),
+                "created_at": round(now - rng.uniform(0, 365 * 24 * 60 * 60)),
+            })
+    return pd.DataFrame(rows)
+
+
+def timed(fn, queries):
+    times = []
+    for lat, lon in queries:
+        start = time.perf_counter()
+        fn(lat, lon)
+        times.append((time.perf_counter() - start) * 1000)
+    return {"p50_ms": percentile(times, 50), "p95_ms": percentile(times, 95), "p99_ms": percentile(times, 99)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="병원 공간 인덱스 벤치마크")
+    parser.add_argument("--clinics", type=int, default=50000, help="가짜 병원 수")
+    parser.add_argument("--queries", type=int, default=2000, help="검색 횟수")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--radius-km", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--write", help="만든 병원 데이터를 CSV 로 저장하고 끝낸다")
+    parser.add_argument("--write-ratings", help="--write 와 함께: 가짜 평점도 CSV 로 저장한다")
+    parser.add_argument("--out", default="bench_clinics.json", help="JSON 리포트 경로")
+    args = parser.parse_args()
+
+    clinics = make_clinics(args.clinics, args.seed)
+    if args.write:
+        clinics.to_csv(args.write, index=False, encoding="utf-8")
+        print(f"{len(clinics)}개 병원 저장: {args.write}")
+        if args.write_ratings:
+            ratings = make_ratings(clinics, args.seed)
+            ratings.to_csv(args.write_ratings, index=False, encoding="utf-8")
+            print(f"{len(ratings)}개 평점 저장: {args.write_ratings}")
+        return
+
+    from clinics import ClinicIndex, haversine_km
+
+    start = time.perf_counter()
+    index = ClinicIndex(clinics)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # 검색 위치는 병원 근처에서 고른다
+    rng = np.random.default_rng(args.seed)
+    picks = rng.integers(0, len(clinics), args.queries)
+    queries = list(zip(
+        clinics["latitude"].to_numpy()[picks] + rng.normal(0, 0.02, args.queries),
+        clinics["longitude"].to_numpy()[picks] + rng.normal(0, 0.02, args.queries),
+    ))
+    lats = clinics["latitude"].to_numpy()
+    lons = clinics["longitude"].to_numpy()
+
+    def brute_nearest(lat, lon):
+        return np.argsort(haversine_km(lat, lon, lats, lons))[:args.k]
+
+    mismatches = sum(
+        not np.allclose(
+            np.sort(haversine_km(lat, lon, lats, lons))[:args.k],
+            index.nearest_ids(lat, lon, args.k)[1],
+        )
+        for lat, lon in queries[:200]
+    )
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "clinics": len(clinics),
+        "cells": index._cell_count,
+        "build_ms": build_ms,
+        "k": args.k,
+        "radius_km": args.radius_km,
+        # 인덱스 검색만 / 결과 DataFrame 만들기까지 따로 잰다
+        "nearest": timed(lambda lat, lon: index.nearest_ids(lat, lon, args.k), queries),
+        "within": timed(lambda lat, lon: index.within_ids(lat, lon, args.radius_km), queries),
+        "nearest_dataframe": timed(lambda lat, lon: index.nearest(lat, lon, args.k), queries),
+        "brute_force_nearest": timed(brute_nearest, queries),
+        "nearest_mismatches": mismatches,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"병원 {len(clinics)}개, 인덱스 생성 {build_ms:.1f}ms, 격자 {report['cells']}칸")
+    for name in ("nearest", "within", "nearest_dataframe", "brute_force_nearest"):
+        print(f"{name:>20}: p50 {report[name]['p50_ms']:.3f}ms  p95 {report[name]['p95_ms']:.3f}ms")
+    print(f"k-최근접 결과 불일치: {mismatches}/200")
+    print(f"리포트 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""대화 페이지 동시 사용자 부하 생성기.
+
+가상 사용자 N 명이 각자 AppTest 세션으로 chat_bot() 페이지를 열고 메시지를 보낸다.
+감정 분류 -> 프롬프트 구성 -> LLM(로컬 가짜 서버) -> 화면 렌더링까지 전체 경로를 거치며,
+메시지별 종단 지연시간 백분위수와 처리량을 JSON 리포트로 남긴다.
+
+    python bench/load_chat.py --users 20 --messages 5 --ttft-ms 400 --token-ms 20
+    python bench/load_chat.py --users 50 --base-url http://127.0.0.1:8765/v1   # 따로 띄운 가짜 서버 사용
+
+앱의 LLM 호출량 제한(LLM_RATE_PER_SEC 등)도 그대로 적용되므로, 제한 자체를 보려는 게 아니면 환경변수로 넉넉히 올린다.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_app import page_script, percentile, git_commit  # noqa: E402
+from bench_classifier import load_corpus  # noqa: E402
+import stub_openai_server  # noqa: E402
+
+
+def virtual_user(index, args, corpus, results, start_barrier):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_function(page_script, args=("user", "chat_bot"), default_timeout=args.timeout)
+    at.secrets["OPENAI_API_KEY"] = "stub"
+    at.session_state["logged_in"] = True
+    at.session_state["username"] = f"load-user-{index}"
+    at.session_state["role"] = "user"
+    at.run()
+
+    rng = random.Random(index)
+    start_barrier.wait()
+    for _ in range(args.messages):
+        time.sleep(rng.uniform(0, args.think_time))
+        message = rng.choice(corpus)
+        start = time.perf_counter()
+        error = None
+        try:
+            at.chat_input[0].set_value(message).run()
+            if at.exception:
+                error = at.exception[0].message
+            elif at.error:
+                error = at.error[0].value
+            elif at.warning:
+                error = at.warning[0].value
+        except Exception as e:
+            error = str(e)
+        results.append({
+            "user": index,
+            "seconds": time.perf_counter() - start,
+            "error": error,
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대화 페이지 부하 생성기")
+    parser.add_argument("--users", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("--messages", type=int, default=5, help="사용자당 보낼 메시지 수")
+    parser.add_argument("--think-time", type=float, default=1.0, help="메시지 사이 최대 대기(초)")
+    parser.add_argument("--timeout", type=float, default=120, help="메시지 하나의 최대 처리 시간(초)")
+    parser.add_argument("--base-url", help="이미 떠 있는 OpenAI 호환 서버 주소 (없으면 내장 가짜 서버를 띄움)")
+    parser.add_argument("--port", type=int, default=8765, help="내장 가짜 서버 포트")
+    parser.add_argument("--model-delay", type=float, default=0.02, help="가짜 감정 분류기 배치당 지연(초)")
+    parser.add_argument("--real-model", action="store_true", help="가짜 분류기 대신 실제 KoELECTRA 사용")
+    parser.add_argument("--out", default="load_chat.json", help="JSON 리포트 경로")
+    stub_openai_server.add_arguments(parser)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)  # 이미지 파일을 상대 경로로 연다
+    stub = None
+    if args.base_url is None:
+        stub = stub_openai_server.config_from_args(args)
+        stub_openai_server.start_server(stub, port=args.port)
+        args.base_url = f"http://127.0.0.1:{args.port}/v1"
+    os.environ["OPENAI_BASE_URL"] = args.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "stub")
+
+    # 가상 사용자 대화가 앱의 실제 저장소(대화 기록, 캐시)에 섞이지 않게 한다
+    if args.real_model:
+        from stubs import isolate_stores
+        isolate_stores()
+    else:
+        from stubs import install_stubs
+        install_stubs(model_delay=args.model_delay, llm=False)
+    from emotion_model import get_emotion_model
+    get_emotion_model().wait()
+
+    corpus = load_corpus()
+    results = []
+    barrier = threading.Barrier(args.users + 1)
+    threads = [
+        threading.Thread(target=virtual_user, args=(i, args, corpus, results, barrier), daemon=True)
+        for i in range(args.users)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    ok = [r["seconds"] for r in results if r["error"] is None]
+    errors = [r for r in results if r["error"] is not None]
+
+    from llm_client import get_connection_stats
+    from llm_limiter import get_llm_limiter
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "users": args.users,
+        "messages_per_user": args.messages,
+        "base_url": args.base_url,
+        "real_model": args.real_model,
+        "elapsed_seconds": elapsed,
+        "messages": len(results),
+        "succeeded": len(ok),
+        "failed": len(errors),
+        "throughput_msgs_per_sec": len(ok) / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": percentile(ok, 50) * 1000,
+            "p95": percentile(ok, 95) * 1000,
+            "p99": percentile(ok, 99) * 1000,
+            "max": max(ok) * 1000,
+        } if ok else None,
+        "error_samples": sorted({str(r["error"]) for r in errors})[:10],
+        "stub_requests": stub.requests if stub else None,
+        "emotion_batcher": get_emotion_model().batcher.stats(),
+        "llm_limiter": get_llm_limiter().stats(),
+        "openai_connections": get_connection_stats().stats(),
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"{len(ok)}/{len(results)} 성공, {report['throughput_msgs_per_sec']:.2f} msg/s")
+    if ok:
+        latency = report["latency_ms"]
+        print(f"지연시간 p50 {latency['p50']:.0f}ms  p95 {latency['p95']:.0f}ms  p99 {latency['p99']:.0f}ms")
+    print(f"리포트 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""OpenAI chat-completions 호환 로컬 가짜 서버 (부하 테스트용).
+
+실제 API 대신 응답 지연(첫 토큰까지 로그정규 분포 + 토큰당 지연), 스트리밍(SSE),
+오류 주입(429 / 500)을 흉내 낸다. 앱은 OPENAI_BASE_URL 로 이 서버를 바라보게 하면 된다.
+
+    python bench/stub_openai_server.py --port 8765 --ttft-ms 400 --token-ms 20 --error-rate 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub streamlit run app.py
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ANSWER = (
+    "많이 힘드셨겠어요. 그런 마음이 드는 건 자연스러운 일이에요. "
+    "오늘은 잠깐 산책을 하거나 좋아하는 음악을 들으면서 마음을 쉬게 해 보는 건 어떨까요? "
+    "그리고 믿을 수 있는 사람에게 지금 기분을 조금이라도 털어놓아 보세요. "
+    "혹시 요즘 특히 힘들게 느껴지는 일이 있다면 더 이야기해 줄래요?"
+)
+
+
+class StubConfig:
+    def __init__(self, ttft_ms=400.0, ttft_sigma=0.5, token_ms=20.0, error_rate=0.0, rate_limit_rate=0.0, tokens=None):
+        self.ttft_ms = ttft_ms
+        self.ttft_sigma = ttft_sigma
+        self.token_ms = token_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.tokens = tokens
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def first_token_delay(self):
+        # 중앙값이 ttft_ms 인 로그정규 분포
+        return random.lognormvariate(0, self.ttft_sigma) * self.ttft_ms / 1000
+
+    def answer_tokens(self):
+        words = ANSWER.split(" ")
+        if self.tokens:
+            words = (words * (self.tokens // len(words) + 1))[:self.tokens]
+        return [word if i == 0 else " " + word for i, word in enumerate(words)]
+
+
+def make_handler(config):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive 연결 재사용
+
+        def log_message(self, format, *args):
+            pass
+
+        def _json(self, status, body, headers=None):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _chunk(self, data):
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            with config.lock:
+                config.requests += 1
+
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                return self._json(404, {"error": {"message": "not found", "type": "invalid_request_error"}})
+
+            # 오류 주입
+            roll = random.random()
+            if roll < config.rate_limit_rate:
+                return self._json(
+                    429,
+                    {"error": {"message": "Rate limit reached (stub)", "type": "rate_limit_exceeded"}},
+                    {"retry-after-ms": "200"},
+                )
+            if roll < config.rate_limit_rate + config.error_rate:
+                return self._json(500, {"error": {"message": "Internal error (stub)", "type": "server_error"}})
+
+            model = request.get("model", "gpt-4o-mini")
+            completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+            created = int(time.time())
+            tokens = config.answer_tokens()
+            time.sleep(config.first_token_delay())
+
+            if not request.get("stream"):
+                time.sleep(config.token_ms * len(tokens) / 1000)
+                return self._json(200, {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "".join(tokens)},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)},
+                })
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i, token in enumerate(tokens + [None]):
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "delta": {"content": token} if token is not None else {},
+                        "finish_reason": None if token is not None else "stop",
+                    }],
+                }
+                if i:
+                    time.sleep(config.token_ms / 1000)
+                self._chunk(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self._chunk(b"data: [DONE]\n\n")
+            self._chunk(b"")
+
+    return Handler
+
+
+def start_server(config, host="127.0.0.1", port=8765):
+    # 부하 생성기가 같은 프로세스에서 띄울 때 쓴다
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="stub-openai", daemon=True).start()
+    return server
+
+
+def add_arguments(parser):
+    parser.add_argument("--ttft-ms", type=float, default=400, help="첫 토큰까지 지연 중앙값(ms)")
+    parser.add_argument("--ttft-sigma", type=float, default=0.5, help="첫 토큰 지연 로그정규 sigma")
+    parser.add_argument("--token-ms", type=float, default=20, help="토큰당 지연(ms)")
+    parser.add_argument("--tokens", type=int, help="답변 토큰 수 (기본: 고정 답변 길이)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 오류 비율")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 오류 비율")
+
+
+def config_from_args(args):
+    return StubConfig(args.ttft_ms, args.ttft_sigma, args.token_ms, args.error_rate, args.rate_limit_rate, args.tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 가짜 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(config_from_args(args)))
+    server.daemon_threads = True
+    print(f"가짜 OpenAI 서버: http://{args.host}:{args.port}/v1")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""벤치마크용 가짜 감정 분류기 / OpenAI 클라이언트 / 지오코더.
+
+네트워크와 모델 다운로드 없이 앱을 돌리기 위해 install_stubs() 로 실제 객체를 바꿔 끼운다.
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+LABELS = ["angry", "happy", "anxious", "embarrassed", "sad", "hurt"]
+STUB_BACKEND = "stub"  # 가짜 분류기 결과가 실제 백엔드(torch 등) 캐시 키와 섞이지 않게 따로 이름을 붙인다
+
+# 벤치마크가 앱의 실제 디스크 저장소에 쓰지 않도록 임시 디렉터리로 돌릴 경로들
+STORE_PATHS = {
+    "EMOTION_CACHE_PATH": "emotion_cache.sqlite3",
+    "CHAT_STORE_PATH": "chat_history.sqlite3",
+    "REPLY_CACHE_PATH": "reply_cache.sqlite3",
+    "GEOCODER_CACHE_PATH": "geocode_cache.sqlite3",
+    "RATINGS_PATH": "clinic_ratings.sqlite3",
+    "CHAT_METRICS_PATH": "chat_metrics.json",
+}
+STORE_MODULES = ["emotion_cache", "chat_store", "reply_cache", "geocoder", "ratings", "chat_metrics"]
+
+
+def isolate_stores():
+    """저장소 경로 환경변수를 임시 디렉터리로 바꾼다. 앱 모듈을 import 하기 전에 불러야 한다."""
+    loaded = [module for module in STORE_MODULES if module in sys.modules]
+    if loaded:
+        raise RuntimeError(f"저장소 모듈이 이미 import 되어 경로를 바꿀 수 없습니다: {', '.join(loaded)}")
+    scratch = tempfile.mkdtemp(prefix="churros-bench-")
+    for name, filename in STORE_PATHS.items():
+        os.environ.setdefault(name, os.path.join(scratch, filename))
+    return scratch
+
+
+# 가짜 감정 분류기 ---------------------------------------------
+class FakeClassifier:
+    # transformers pipeline(return_all_scores=True) 와 같은 모양으로 결과를 돌려준다
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def scores(self, text):
+        digest = hashlib.md5(text.encode("utf-8")).digest()
+        raw = [b + 1 for b in digest[:len(LABELS)]]
+        total = sum(raw)
+        return [{"label": label, "score": r / total} for label, r in zip(LABELS, raw)]
+
+    def __call__(self, inputs, **kwargs):
+        if self.delay:
+            time.sleep(self.delay)
+        if isinstance(inputs, str):
+            return [self.scores(inputs)]
+        return [self.scores(text) for text in inputs]
+
+
+# 가짜 OpenAI 클라이언트 -------------------------------------------
+class _FakeCompletions:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def create(self, model, messages, stream=False, **kwargs):
+        answer = "많이 힘드셨겠어요. 천천히 이야기해 주세요."
+        if stream:
+            return self._stream(answer)
+        if self.delay:
+            time.sleep(self.delay)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=answer))])
+
+    def _stream(self, answer):
+        # 지연 시간을 토큰(여기서는 어절) 단위로 나눠 흘려보낸다
+        tokens = answer.split(" ")
+        for i, token in enumerate(tokens):
+            if self.delay:
+                time.sleep(self.delay / len(tokens))
+            text = token if i == 0 else " " + token
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class FakeOpenAI:
+    def __init__(self, api_key=None, delay=0.0, **kwargs):
+        self.chat = SimpleNamespace(completions=_FakeCompletions(delay))
+
+    def with_options(self, **kwargs):
+        return self
+
+
+# 가짜 지오코더 ------------------------------------------------
+class FakeNominatim:
+    def __init__(self, user_agent=None, **kwargs):
+        pass
+
+    def geocode(self, query, **kwargs):
+        digest = hashlib.md5(query.encode("utf-8")).digest()
+        return SimpleNamespace(
+            latitude=37.45 + digest[0] / 1000,
+            longitude=126.85 + digest[1] / 1000,
+            address=query,
+        )
+
+
+def install_stubs(model_delay=0.0, llm_delay=0.0, llm=True, geocoder=True):
+    # 저장소를 임시 디렉터리로 돌리고 백엔드 이름을 바꾼 뒤에 앱 모듈을 import 한다
+    if "emotion_backends" in sys.modules:
+        raise RuntimeError("install_stubs() 는 앱 모듈을 import 하기 전에 불러야 합니다.")
+    isolate_stores()
+    os.environ["EMOTION_BACKEND"] = STUB_BACKEND
+
+    # 앱 코드가 함수 안에서 import 하므로 모듈 속성을 바꿔 끼우면 된다
+    import emotion_model
+    emotion_model.load_emotion_model = lambda backend=None: FakeClassifier(model_delay)
+
+    if llm:
+        try:
+            import openai
+            openai.OpenAI = lambda *args, **kwargs: FakeOpenAI(*args, delay=llm_delay, **kwargs)
+        except ImportError:
+            pass
+
+    if geocoder:
+        try:
+            import geopy.geocoders
+            geopy.geocoders.Nominatim = FakeNominatim
+        except ImportError:
+            pass
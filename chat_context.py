@@ -0,0 +1,157 @@
+import os
+import threading
+
+# 대화 맥락 설정 -------------------------------------------------
+# 최근 K 턴은 그대로, 그 이전 대화는 요약 하나로 넣고 전체 프롬프트를 토큰 예산 안에 맞춘다
+RECENT_TURNS = int(os.environ.get("CHAT_CONTEXT_TURNS", 3))
+TOKEN_BUDGET = int(os.environ.get("CHAT_CONTEXT_TOKENS", 3000))
+SUMMARY_TOKENS = int(os.environ.get("CHAT_SUMMARY_TOKENS", 300))
+MODEL = "gpt-4o-mini"
+
+# 변하지 않는 지시문은 항상 맨 앞에 둔다 (OpenAI 프롬프트 prefix 캐시가 적용되도록)
+SYSTEM_PROMPT = """너는 따뜻한 심리상담사이다. 사용자의 감정을 공감하고 현실적인 조언을 제공해줘.
+당신은 친절하고 경험 많은 심리상담사야.
+
+- 먼저 사용자의 감정을 충분히 공감하고 이해를 표현해줘.
+- 상황을 개선할 수 있는 현실적 조언이나 방법 2-3가지 제안.
+- 감정 분석 신뢰도가 0.6 미만이면 자연스럽게 되묻기.
+- 말투는 친근하고 따뜻하게 작성.
+- 이전 대화 요약과 최근 대화가 주어지면 흐름을 이어서 답해줘."""
+
+SUMMARY_PROMPT = """다음은 심리상담 대화의 기존 요약과 그 뒤에 이어진 대화야.
+사용자의 주요 감정, 고민, 상담사가 이미 제안한 조언이 드러나도록 5문장 이내로 새 요약을 써줘."""
+
+
+# 토큰 세기 ------------------------------------------------------
+_encoding = None
+
+
+def count_tokens(text):
+    # tiktoken 이 있으면 정확히, 없으면 한글 기준으로 넉넉하게 어림한다
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.encoding_for_model(MODEL)
+        except Exception:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text))
+    return len(text)
+
+
+def message_tokens(message):
+    # 메시지마다 역할/구분자 몫으로 4 토큰 정도 더 든다
+    return count_tokens(message["content"]) + 4
+
+
+def truncate_tokens(text, limit):
+    if count_tokens(text) <= limit:
+        return text
+    if _encoding:
+        return _encoding.decode(_encoding.encode(text)[:limit])
+    return text[:limit]
+
+
+def to_openai(chat):
+    return {"role": "user" if chat["role"] == "user" else "assistant", "content": chat["message"]}
+
+
+class ConversationContext:
+    """세션별 대화 요약 상태. 요약은 답변이 끝난 뒤 백그라운드 스레드에서 갱신한다."""
+
+    def __init__(self):
+        self.summary = ""
+        self.summarized_upto = 1  # chat_history[0] 은 인사말이라 요약하지 않는다
+        self.spilled = 0  # 지금까지 history 에서 떼어 낸 메시지 수 (요약 중에 떼어 내면 위치를 맞춘다)
+        self._lock = threading.Lock()
+        self._running = False
+
+    def build_messages(self, history, user_prompt):
+        # history 에는 이번 사용자 메시지가 이미 들어 있으므로 빼고 만든다
+        previous = history[:-1]
+        with self._lock:
+            summary = self.summary
+            start = max(self.summarized_upto, len(previous) - RECENT_TURNS * 2)
+
+        system = {"role": "system", "content": SYSTEM_PROMPT}
+        current = {"role": "user", "content": user_prompt}
+        recent = [to_openai(chat) for chat in previous[start:]]
+
+        budget = TOKEN_BUDGET - message_tokens(system)
+        current["content"] = truncate_tokens(current["content"], max(budget - 4, 0))
+        budget -= message_tokens(current)
+
+        # 예산이 모자라면 오래된 턴부터 뺀다
+        while recent and sum(message_tokens(m) for m in recent) > budget:
+            recent.pop(0)
+        budget -= sum(message_tokens(m) for m in recent)
+
+        messages = [system]
+        prefix = "이전 대화 요약: "
+        room = budget - message_tokens({"content": prefix})
+        if summary and room > 4:
+            summary = truncate_tokens(summary, room)
+            messages.append({"role": "system", "content": prefix + summary})
+        return messages + recent + [current]
+
+    def has_context(self, history):
+        # 이번 메시지 말고도 요약이나 이전 턴이 프롬프트에 들어가면 답변이 이 사용자 대화에 묶인다
+        with self._lock:
+            return bool(self.summary) or len(history) > 2
+
+    def maybe_summarize(self, client, history, user):
+        # 최근 K 턴 밖으로 밀려난 메시지가 있으면 기존 요약에 합친다
+        with self._lock:
+            end = len(history) - RECENT_TURNS * 2
+            if self._running or end <= self.summarized_upto:
+                return
+            self._running = True
+            overflow = list(history[self.summarized_upto:end])
+            summary = self.summary
+            spilled = self.spilled
+        threading.Thread(
+            target=self._summarize, args=(client, user, summary, overflow, end, spilled), name="chat-summary", daemon=True
+        ).start()
+
+    def spill(self, history, keep):
+        # 오래된 메시지를 keep 개만 남기고 history 에서 떼어 돌려준다 (인사말 history[0] 은 남긴다)
+        # 저장소에는 이미 다 있으므로, 요약이 실패하거나 건너뛰어져도 세션 메모리는 늘지 않는다
+        with self._lock:
+            count = len(history) - keep
+            if count <= 0:
+                return []
+            spilled = history[1:1 + count]
+            del history[1:1 + count]
+            self.summarized_upto = max(1, self.summarized_upto - count)
+            self.spilled += count
+            return spilled
+
+    def _summarize(self, client, user, summary, overflow, end, spilled):
+        from llm_limiter import get_llm_limiter
+
+        try:
+            transcript = "\n".join(
+                f"{'사용자' if chat['role'] == 'user' else '상담사'}: {chat['message']}" for chat in overflow
+            )
+            # 요약 호출도 같은 호출량 제한을 받는다 (같은 사용자 차례로 줄 선다)
+            response = get_llm_limiter().call(user, client, lambda client: client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": SUMMARY_PROMPT},
+                    {"role": "user", "content": f"기존 요약: {summary or '(없음)'}\n\n이어진 대화:\n{transcript}"},
+                ],
+                temperature=0.3,
+                max_tokens=SUMMARY_TOKENS,
+            ))
+            new_summary = response.choices[0].message.content or summary
+            with self._lock:
+                self.summary = new_summary
+                # 요약하는 동안 앞쪽 메시지가 떼어졌으면 그만큼 당긴다
+                self.summarized_upto = max(1, end - (self.spilled - spilled))
+        except Exception:
+            # 요약에 실패하면 다음 답변 뒤에 다시 시도한다 (그동안은 최근 턴만 들어간다)
+            pass
+        finally:
+            with self._lock:
+                self._running = False
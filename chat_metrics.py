@@ -0,0 +1,140 @@
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import streamlit as st
+
+# 대화 단계별 지연시간 설정 -----------------------------------------
+# 단계마다 최근 WINDOW 초 동안의 히스토그램을 유지하고, 주기적으로 JSON 파일로 내보낸다
+WINDOW_SECONDS = int(os.environ.get("CHAT_METRICS_WINDOW", 600))
+SLICE_SECONDS = int(os.environ.get("CHAT_METRICS_SLICE", 60))
+EXPORT_SECONDS = float(os.environ.get("CHAT_METRICS_EXPORT_INTERVAL", 10))
+METRICS_PATH = os.environ.get(
+    "CHAT_METRICS_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".chat_data", "chat_metrics.json"),
+)
+
+# 히스토그램 구간 상한(ms). 마지막 구간은 그보다 긴 것 전부
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 7500, 10000, 20000, 60000]
+
+# chat_bot() 한 번의 처리 단계 (표시 순서)
+STAGES = {
+    "render": "대화 렌더링",
+    "classify": "감정 분류",
+    "prompt": "프롬프트 구성",
+    "llm_wait": "LLM 대기 + 첫 토큰",
+    "llm_stream": "LLM 스트리밍",
+    "total": "전체",
+}
+
+
+class RollingHistogram:
+    """고정 구간 히스토그램을 SLICE 초 단위 조각으로 나눠 들고, WINDOW 를 넘긴 조각은 버린다."""
+
+    def __init__(self, window=WINDOW_SECONDS, slice_seconds=SLICE_SECONDS):
+        self.window = window
+        self.slice_seconds = slice_seconds
+        self._slices = deque()  # (조각 시작 시각, 구간별 개수, 합계 ms)
+
+    def observe(self, ms, now):
+        start = now - now % self.slice_seconds
+        if not self._slices or self._slices[-1][0] != start:
+            self._slices.append((start, [0] * (len(BUCKETS_MS) + 1), [0.0]))
+        _, counts, total = self._slices[-1]
+        counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        total[0] += ms
+
+    def snapshot(self, now):
+        while self._slices and self._slices[0][0] <= now - self.window:
+            self._slices.popleft()
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        total = 0.0
+        for _, slice_counts, slice_total in self._slices:
+            for i, count in enumerate(slice_counts):
+                counts[i] += count
+            total += slice_total[0]
+        return counts, total
+
+
+def percentile(counts, q):
+    # 해당 구간 안에서는 선형으로 보간한다
+    n = sum(counts)
+    if not n:
+        return None
+    rank = q / 100 * n
+    seen = 0
+    for i, count in enumerate(counts):
+        if count and seen + count >= rank:
+            low = BUCKETS_MS[i - 1] if i else 0
+            high = BUCKETS_MS[i] if i < len(BUCKETS_MS) else BUCKETS_MS[-1]
+            return low + (high - low) * (rank - seen) / count
+        seen += count
+    return float(BUCKETS_MS[-1])
+
+
+class ChatMetrics:
+    def __init__(self, path=METRICS_PATH):
+        self.path = path
+        self._histograms = {stage: RollingHistogram() for stage in STAGES}
+        self._lock = threading.Lock()
+        if path:
+            threading.Thread(target=self._exporter, name="chat-metrics", daemon=True).start()
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            self._histograms[stage].observe(seconds * 1000, time.time())
+
+    @contextmanager
+    def span(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def stats(self):
+        now = time.time()
+        result = {}
+        with self._lock:
+            for stage, histogram in self._histograms.items():
+                counts, total = histogram.snapshot(now)
+                n = sum(counts)
+                result[stage] = {
+                    "count": n,
+                    "mean_ms": total / n if n else None,
+                    "p50_ms": percentile(counts, 50),
+                    "p95_ms": percentile(counts, 95),
+                    "p99_ms": percentile(counts, 99),
+                    "buckets": counts,
+                }
+        return result
+
+    def export(self):
+        report = {
+            "timestamp": time.time(),
+            "window_seconds": WINDOW_SECONDS,
+            "bucket_bounds_ms": BUCKETS_MS,
+            "stages": self.stats(),
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _exporter(self):
+        while True:
+            time.sleep(EXPORT_SECONDS)
+            try:
+                self.export()
+            except OSError:
+                pass
+
+
+@st.cache_resource
+def get_chat_metrics():
+    return ChatMetrics()
@@ -9,7 +9,7 @@ from streamlit_folium import st_folium
 from geopy.geocoders import Nominatim
 import plotly.express as px
 from PIL import Image
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
+from emotion_model import get_emotion_model, retry_emotion_model, predict_emotion, READY, FAILED
 from openai import OpenAI
 from dotenv import load_dotenv
 import os
@@ -17,6 +17,9 @@ import os
 # 페이지 기본 설정
 st.set_page_config(page_title="츄러스미 심리케어",layout='wide')
 
+# 감정 분석 모델 워밍업 시작 (로그인 화면은 기다리지 않음)
+get_emotion_model()
+
 # 사용자 DB -------------------------------------------
 User_DB = {
     "admin": {"password": "admin123", "role": "admin"},
@@ -271,33 +274,6 @@ def my_dashboard():
         st.write("🎵 노래 - 아기상어")
 
 
-@st.cache_resource
-def load_emotion_model():
-    model_name = "Jinuuuu/KoELECTRA_fine_tunning_emotion"
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
-    model = AutoModelForSequenceClassification.from_pretrained(model_name)
-    return pipeline("text-classification", model=model, tokenizer=tokenizer, return_all_scores=True)
-
-emotion_classifier = load_emotion_model()
-
-# 레이블 매핑
-label_map = {
-    "angry": "분노",
-    "happy": "행복",
-    "anxious": "불안",
-    "embarrassed": "당황",
-    "sad": "슬픔",
-    "hurt": "상처"
-}
-
-# 감정 예측 함수
-def predict_emotion(text: str):
-    result = emotion_classifier(text)[0]
-    best = max(result, key=lambda x: x["score"])
-    emotion = label_map.get(best["label"], best["label"])
-    score = best["score"]
-    return emotion, score
-
 # -----------------------------
 # 챗봇 함수
 # -----------------------------
@@ -338,8 +314,21 @@ def chat_bot():
             {"role": "bot", "message": "안녕하세요! 필요한 도움이 있으신가요? 당신의 이야기를 들려주세요. 😊"}
         ]
 
+    # --- 감정 분석 모델 준비 상태 확인 ---
+    model = get_emotion_model()
+    if model.status == FAILED:
+        st.error(f"감정 분석 모델을 불러오지 못했습니다. 오류: {model.error}")
+        if st.button("🔄 다시 시도", key="retry_emotion_model"):
+            retry_emotion_model()
+            st.rerun()
+    elif model.status != READY:
+        st.info("심린이가 대화할 준비를 하고 있어요... 잠시만 기다려 주세요 ⏳")
+
     # --- 사용자 입력 받기 ---
-    user_input = st.chat_input("💬 오늘 기분은 어땠나요? (예: 오늘 너무 속상했어...)")
+    user_input = st.chat_input(
+        "💬 오늘 기분은 어땠나요? (예: 오늘 너무 속상했어...)",
+        disabled=model.status != READY
+    )
 
     if user_input:
         # 1️⃣ 사용자 메시지 바로 추가
@@ -348,18 +337,7 @@ def chat_bot():
         with st.spinner("당신의 감정을 분석하고 상담사 연결 중... 🧘‍♀️"):
             try:
                 # 2️⃣ 감정분류 (문자 레이블 처리)
-                result = emotion_classifier(user_input)[0]
-                best = max(result, key=lambda x: x["score"])
-                label_map = {
-                    "angry": "분노",
-                    "happy": "행복",
-                    "anxious": "불안",
-                    "embarrassed": "당황",
-                    "sad": "슬픔",
-                    "hurt": "상처"
-                }
-                emotion = label_map.get(best["label"], best["label"])
-                score = best["score"]
+                emotion, score = predict_emotion(user_input)
 
                 # 3️⃣ GPT 프롬프트 구성
                 prompt = f"""
@@ -0,0 +1,143 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+# 대화 기록 저장소 설정 --------------------------------------------
+# 메시지는 추가만 하고, 실제 쓰기는 백그라운드 스레드가 모아서 한 번에 한다 (답변 지연에 영향 없음)
+STORE_PATH = os.environ.get(
+    "CHAT_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".chat_data", "chat_history.sqlite3"),
+)
+WRITE_BATCH = int(os.environ.get("CHAT_STORE_WRITE_BATCH", 100))
+
+
+class ChatStore:
+    """사용자/대화별 메시지 기록 (SQLite WAL, 추가 전용)."""
+
+    def __init__(self, path=STORE_PATH):
+        self.written = 0
+        self.failed = 0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = self._connect(path)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS chat_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user TEXT NOT NULL,
+                conversation_id TEXT NOT NULL,
+                ts REAL NOT NULL,
+                role TEXT NOT NULL,
+                message TEXT NOT NULL,
+                scores TEXT
+            )"""
+        )
+        # 감정 점수(scores) 열이 생기기 전에 만든 저장소에는 열만 더한다
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(chat_messages)")}
+        if "scores" not in columns:
+            self._db.execute("ALTER TABLE chat_messages ADD COLUMN scores TEXT")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS chat_messages_user_conv_ts ON chat_messages (user, conversation_id, ts)"
+        )
+        # 사용자별 마지막 대화 찾기(latest_conversation)와 감정 점수 읽기는 대화와 상관없이 시각 순으로 본다
+        self._db.execute("CREATE INDEX IF NOT EXISTS chat_messages_user_ts ON chat_messages (user, ts)")
+        self._db.commit()
+        # 읽기와 쓰기는 연결을 따로 쓴다 (WAL 이라 쓰는 중에도 읽을 수 있다)
+        threading.Thread(target=self._writer, args=(self._connect(path),), name="chat-store", daemon=True).start()
+
+    @staticmethod
+    def _connect(path):
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    # 쓰기 ---------------------------------------------------------
+    def append(self, user, conversation_id, chat):
+        # chat 은 chat_history 의 메시지 dict. 시각(ts)이 없으면 지금 시각을 넣는다
+        # 사용자 메시지는 감정 점수 분포(scores)도 같이 남긴다 (재시작 뒤 감정 집계를 다시 만드는 데 쓴다)
+        chat.setdefault("ts", time.time())
+        scores = json.dumps(chat["scores"], ensure_ascii=False) if chat.get("scores") else None
+        self._queue.put((user, conversation_id, chat["ts"], chat["role"], chat["message"], scores))
+
+    def _writer(self, db):
+        while True:
+            rows = [self._queue.get()]
+            while len(rows) < WRITE_BATCH:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                db.executemany(
+                    "INSERT INTO chat_messages (user, conversation_id, ts, role, message, scores) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                db.commit()
+                self.written += len(rows)
+            except sqlite3.Error:
+                db.rollback()
+                self.failed += len(rows)
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+
+    def flush(self):
+        # 쌓인 쓰기가 모두 끝날 때까지 기다린다 (테스트/벤치마크용)
+        self._queue.join()
+
+    # 읽기 ---------------------------------------------------------
+    def latest_conversation(self, user):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT conversation_id FROM chat_messages WHERE user = ? ORDER BY ts DESC LIMIT 1", (user,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def page(self, user, conversation_id, limit, before=None):
+        # before 시각보다 이전 메시지 중 최근 limit 개 (오래된 것부터)
+        if limit <= 0:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                """SELECT ts, role, message FROM chat_messages
+                WHERE user = ? AND conversation_id = ? AND ts < ?
+                ORDER BY ts DESC LIMIT ?""",
+                (user, conversation_id, float("inf") if before is None else before, limit),
+            ).fetchall()
+        return [{"role": role, "message": message, "ts": ts} for ts, role, message in reversed(rows)]
+
+    def emotion_scores(self, user):
+        # 사용자의 메시지별 감정 점수 [(conversation_id, ts, scores)] (오래된 것부터)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT conversation_id, ts, scores FROM chat_messages WHERE user = ? AND scores IS NOT NULL ORDER BY ts",
+                (user,),
+            ).fetchall()
+        return [(conversation_id, ts, json.loads(scores)) for conversation_id, ts, scores in rows]
+
+    def count(self, user, conversation_id):
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM chat_messages WHERE user = ? AND conversation_id = ?", (user, conversation_id)
+            ).fetchone()[0]
+
+    def stats(self):
+        with self._lock:
+            messages = self._db.execute("SELECT COUNT(*) FROM chat_messages").fetchone()[0]
+        return {
+            "messages": messages,
+            "written": self.written,
+            "failed": self.failed,
+            "pending": self._queue.qsize(),
+        }
+
+
+@st.cache_resource
+def get_chat_store():
+    return ChatStore()
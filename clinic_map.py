@@ -0,0 +1,121 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import streamlit as st
+
+from clinics import EARTH_RADIUS_KM, KM_PER_DEGREE
+
+# 병원 지도 설정 ---------------------------------------------------
+# 기본 지도(타일 + 주변 병원 클러스터)는 (중심 격자, 줌 단계) 마다 한 번만 만들어 두고,
+# 매번 바뀌는 내 위치/가까운 병원 마커만 st_folium 의 동적 레이어로 얹는다
+MAP_MODE = os.environ.get("HOSPITAL_MAP_MODE", "cluster")  # "cluster": 주변 병원을 브라우저에서 묶어 그림, "markers": 가까운 병원만
+MAP_WIDTH = 700
+MAP_HEIGHT = 450
+ZOOM_BUCKETS = (9, 11, 13, 15)
+MAP_REACH = float(os.environ.get("HOSPITAL_MAP_REACH", 3.0))  # 지도 폭의 몇 배 범위까지 병원을 실을지
+MAX_POINTS = int(os.environ.get("HOSPITAL_MAP_MAX_POINTS", 5000))
+CACHE_SIZE = int(os.environ.get("HOSPITAL_MAP_CACHE_SIZE", 64))
+
+# 클러스터 안의 병원은 [위도, 경도, 이름] 배열로만 보내고 마커는 브라우저에서 만든다
+CLUSTER_CALLBACK = """
+    var callback = function (row) {
+        var marker = L.marker(new L.LatLng(row[0], row[1]));
+        marker.bindTooltip(row[2]);
+        return marker;
+    };
+"""
+
+
+def zoom_bucket(zoom):
+    return max([bucket for bucket in ZOOM_BUCKETS if bucket <= zoom] or [ZOOM_BUCKETS[0]])
+
+
+def reach_km(zoom):
+    # 256px 타일 기준, 지도 가로폭(MAP_WIDTH px)이 덮는 거리 x MAP_REACH 의 절반 (위도는 한국 평균으로 본다)
+    km_per_px = 2 * np.pi * EARTH_RADIUS_KM * np.cos(np.radians(36.5)) / (256 * 2 ** zoom)
+    return MAP_REACH * MAP_WIDTH * km_per_px / 2
+
+
+class ClinicMapCache:
+    """(중심 격자, 줌 단계) -> 미리 그려 둔 기본 folium 지도. 세션끼리 같이 쓴다."""
+
+    def __init__(self, index, mode=MAP_MODE, size=CACHE_SIZE):
+        self.index = index
+        self.mode = mode
+        self.size = size
+        self.builds = 0
+        self.hits = 0
+        self._maps = OrderedDict()  # key -> (지도, 지도별 잠금)
+        self._lock = threading.Lock()
+
+    def _key(self, lat, lon, zoom):
+        # 중심은 불러오는 반경의 절반 간격 격자에 맞춘다 -> 실제 위치는 언제나 불러온 범위 안쪽에 있다
+        bucket = zoom_bucket(zoom)
+        step = reach_km(bucket) / KM_PER_DEGREE / 2
+        return round(lat / step), round(lon / step), bucket, step
+
+    def _build(self, lat, lon, bucket):
+        import folium
+        from folium.plugins import FastMarkerCluster
+
+        m = folium.Map(location=[lat, lon], zoom_start=bucket)
+        if self.mode == "cluster":
+            ids, _ = self.index.within_ids(lat, lon, 2 * reach_km(bucket), limit=MAX_POINTS)
+            clinics = self.index.clinics
+            points = zip(
+                clinics["latitude"].to_numpy()[ids].round(5).tolist(),
+                clinics["longitude"].to_numpy()[ids].round(5).tolist(),
+                clinics["name"].to_numpy()[ids].tolist(),
+            )
+            FastMarkerCluster([list(point) for point in points], callback=CLUSTER_CALLBACK, name="병원").add_to(m)
+        # st_folium 에는 render=False 로 넘기므로 문서 헤더(css/js 링크)까지 여기서 한 번 그려 둔다
+        m.get_root().render()
+        return m
+
+    def base_map(self, lat, lon, zoom):
+        """(지도, 잠금). 지도에 동적 레이어를 붙였다 떼는 동안은 잠금을 잡는다."""
+        row, col, bucket, step = self._key(lat, lon, zoom)
+        key = (row, col, bucket)
+        with self._lock:
+            entry = self._maps.get(key)
+            if entry is not None:
+                self._maps.move_to_end(key)
+                self.hits += 1
+                return entry
+        # 만드는 동안은 잠그지 않는다 (같은 칸을 두 세션이 동시에 만들면 나중 것이 남는다)
+        entry = (self._build(row * step, col * step, bucket), threading.Lock())
+        with self._lock:
+            self._maps[key] = entry
+            self._maps.move_to_end(key)
+            while len(self._maps) > self.size:
+                self._maps.popitem(last=False)
+            self.builds += 1
+        return entry
+
+    def show(self, lat, lon, zoom, layer, key="hospital_map"):
+        """캐시한 기본 지도 위에 layer(folium.FeatureGroup) 만 얹어 보여 준다. 중심/줌은 지도를 다시 그리지 않고 옮긴다."""
+        from streamlit_folium import st_folium
+
+        m, lock = self.base_map(lat, lon, zoom)
+        with lock:
+            try:
+                return st_folium(
+                    m, key=key, width=MAP_WIDTH, height=MAP_HEIGHT, render=False,
+                    center=(lat, lon), zoom=zoom, feature_group_to_add=layer,
+                    returned_objects=[],
+                )
+            finally:
+                # st_folium 은 동적 레이어를 지도에 붙여 두므로, 다음 번 기본 지도에 섞이지 않게 뗀다
+                m._children.pop(layer.get_name(), None)
+
+    def stats(self):
+        with self._lock:
+            return {"mode": self.mode, "maps": len(self._maps), "builds": self.builds, "hits": self.hits}
+
+
+@st.cache_resource
+def get_clinic_map():
+    from clinics import get_clinic_index
+    return ClinicMapCache(get_clinic_index())
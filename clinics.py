@@ -0,0 +1,150 @@
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# 병원 데이터 설정 -------------------------------------------------
+# 정신건강의학과 의원 목록(CSV, 좌표 포함)을 한 번 읽어 격자 공간 인덱스를 만들고 가까운 병원을 찾는다
+# 기본값은 bench/bench_clinics.py 로 만든 가상 병원 목록이다 (실제 병원이 아니므로 화면에 예시 데이터라고 알린다)
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "clinics_sample.csv")
+CLINICS_PATH = os.environ.get("CLINICS_PATH", SAMPLE_PATH)
+GRID_DEGREES = float(os.environ.get("CLINICS_GRID_DEGREES", 0.05))  # 격자 한 칸 (위도 기준 약 5.5km)
+EARTH_RADIUS_KM = 6371.0088
+_ROW_STRIDE = 1 << 20  # 칸 번호 = 행 * _ROW_STRIDE + 열
+KM_PER_DEGREE = EARTH_RADIUS_KM * np.pi / 180
+
+COLUMNS = ["clinic_id", "name", "sido", "sigungu", "address", "phone", "latitude", "longitude"]
+
+# 건강보험심사평가원 병원정보서비스 CSV 열 이름 -> 앱에서 쓰는 이름
+HIRA_COLUMNS = {
+    "암호화요양기호": "clinic_id",
+    "요양기관명": "name",
+    "시도코드명": "sido",
+    "시군구코드명": "sigungu",
+    "주소": "address",
+    "전화번호": "phone",
+    "좌표(Y)": "latitude",
+    "좌표(X)": "longitude",
+}
+
+
+def load_clinics(path=CLINICS_PATH):
+    # 공공데이터 원본은 보통 cp949 로 저장되어 있다
+    try:
+        df = pd.read_csv(path, encoding="utf-8", dtype=str)
+    except UnicodeDecodeError:
+        df = pd.read_csv(path, encoding="cp949", dtype=str)
+    df = df.rename(columns=HIRA_COLUMNS)
+    if "clinic_id" not in df:
+        df["clinic_id"] = [f"C{i:06d}" for i in range(len(df))]
+    for column in COLUMNS:
+        if column not in df:
+            df[column] = ""
+    df = df[COLUMNS].copy()
+    df["latitude"] = pd.to_numeric(df["latitude"], errors="coerce")
+    df["longitude"] = pd.to_numeric(df["longitude"], errors="coerce")
+    df = df.dropna(subset=["latitude", "longitude"]).fillna("")
+    return df.reset_index(drop=True)
+
+
+def using_sample_data():
+    return os.path.abspath(CLINICS_PATH) == SAMPLE_PATH
+
+
+def haversine_km(lat, lon, lats, lons):
+    lat, lon = np.radians(lat), np.radians(lon)
+    lats, lons = np.radians(lats), np.radians(lons)
+    a = np.sin((lats - lat) / 2) ** 2 + np.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+class ClinicIndex:
+    """위경도 격자 인덱스. 병원을 (행, 열) 칸 번호 순으로 정렬해 두면 한 행의 연속된 칸들은 배열의 한 구간이 된다."""
+
+    def __init__(self, clinics, grid_degrees=GRID_DEGREES):
+        self.clinics = clinics
+        self.grid = grid_degrees
+        self._columns = {column: clinics[column].to_numpy() for column in clinics.columns}
+        lats = clinics["latitude"].to_numpy(dtype=np.float64)
+        lons = clinics["longitude"].to_numpy(dtype=np.float64)
+        rows = np.floor(lats / self.grid).astype(np.int64)
+        cols = np.floor(lons / self.grid).astype(np.int64)
+
+        keys = rows * _ROW_STRIDE + cols
+        order = np.argsort(keys, kind="stable")
+        self._order = order
+        self._keys = keys[order]
+        self._lats = lats[order]
+        self._lons = lons[order]
+        self._cell_count = len(np.unique(keys))
+        self._max_lat = float(np.abs(lats).max()) if len(lats) else 0.0
+
+    def __len__(self):
+        return len(self._order)
+
+    def _ring_km(self, lat, ring):
+        # 기준 칸에서 ring 칸 밖에 있는 병원까지의 최소 거리(km). 경도 방향 폭은 북쪽으로 갈수록 좁아진다
+        north = min(max(self._max_lat, abs(lat) + ring * self.grid) + self.grid, 89.0)
+        return 0.99 * ring * self.grid * KM_PER_DEGREE * np.cos(np.radians(north))
+
+    def _candidates(self, lat, lon, ring):
+        # 기준 칸에서 ring 칸 이내 정사각형 안의 병원 (정렬된 배열 위치)
+        if (2 * ring + 1) ** 2 >= self._cell_count:
+            # 칸을 일일이 보는 것보다 전부 보는 게 빠르다
+            return np.arange(len(self))
+        row, col = int(np.floor(lat / self.grid)), int(np.floor(lon / self.grid))
+        base = np.arange(row - ring, row + ring + 1, dtype=np.int64) * _ROW_STRIDE
+        starts = np.searchsorted(self._keys, base + (col - ring), side="left")
+        lengths = np.searchsorted(self._keys, base + (col + ring), side="right") - starts
+        # 행마다 [start, start + length) 구간을 이어 붙인다
+        offsets = np.cumsum(lengths) - lengths
+        return np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)
+
+    def _result(self, ids, distances):
+        # iloc 로 잘라 복사하지 않고 열 배열에서 바로 만든다
+        columns = {column: values[ids] for column, values in self._columns.items()}
+        columns["distance_km"] = distances
+        return pd.DataFrame(columns, index=ids)
+
+    def nearest_ids(self, lat, lon, k=10):
+        """가까운 순서로 k 개의 (clinics 행 번호, 거리 km). 찾은 k 번째보다 안 본 칸이 더 멀어질 때까지 고리를 넓힌다."""
+        k = min(k, len(self))
+        if not k:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        ring = 0
+        while True:
+            positions = self._candidates(lat, lon, ring)
+            everything = len(positions) == len(self)
+            if len(positions) >= k:
+                distances = haversine_km(lat, lon, self._lats[positions], self._lons[positions])
+                top = np.argpartition(distances, k - 1)[:k]
+                top = top[np.argsort(distances[top])]
+                if everything or distances[top[-1]] <= self._ring_km(lat, ring):
+                    return self._order[positions[top]], distances[top]
+            ring += 1
+
+    def within_ids(self, lat, lon, radius_km, limit=None):
+        """반경 radius_km 안의 (clinics 행 번호, 거리 km) 를 가까운 순서로."""
+        if not len(self):
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        ring = 1
+        while self._ring_km(lat, ring) < radius_km and (2 * ring + 1) ** 2 < self._cell_count:
+            ring += 1
+        positions = self._candidates(lat, lon, ring)
+        distances = haversine_km(lat, lon, self._lats[positions], self._lons[positions])
+        inside = distances <= radius_km
+        positions, distances = positions[inside], distances[inside]
+        top = np.argsort(distances)[:limit]
+        return self._order[positions[top]], distances[top]
+
+    def nearest(self, lat, lon, k=10):
+        return self._result(*self.nearest_ids(lat, lon, k))
+
+    def within(self, lat, lon, radius_km, limit=None):
+        return self._result(*self.within_ids(lat, lon, radius_km, limit))
+
+
+@st.cache_resource
+def get_clinic_index():
+    return ClinicIndex(load_clinics())
@@ -0,0 +1,156 @@
+import os
+import numpy as np
+
+# 감정 분류 추론 백엔드 --------------------------------------------
+# EMOTION_BACKEND 환경변수로 고른다: torch(기본, fp32) / int8 / onnx / onnx-int8
+DEFAULT_BACKEND = os.environ.get("EMOTION_BACKEND", "torch")
+CACHE_DIR = os.environ.get("EMOTION_MODEL_CACHE", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".model_cache"))
+MAX_LENGTH = 512
+# 추론 스레드 수 (0 이면 라이브러리 기본값). 워커 프로세스는 EMOTION_WORKER_THREADS 값으로 채운다
+INTRA_OP_THREADS = int(os.environ.get("EMOTION_INTRA_OP_THREADS", 0))
+# 처음 올릴 때 변환한 모델을 CACHE_DIR 에 써 두는 백엔드 (워커 풀은 한 워커가 만든 뒤 나머지를 띄운다)
+DISK_CACHED_BACKENDS = ("onnx", "onnx-int8")
+
+
+def _limit_torch_threads():
+    if INTRA_OP_THREADS:
+        import torch
+        torch.set_num_threads(INTRA_OP_THREADS)
+        torch.set_num_interop_threads(1)
+
+
+def _pipeline(model, tokenizer):
+    from transformers import pipeline
+    return pipeline("text-classification", model=model, tokenizer=tokenizer, return_all_scores=True)
+
+
+def load_torch(model_name):
+    _limit_torch_threads()
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    return _pipeline(model, tokenizer)
+
+
+def load_int8(model_name):
+    # Linear 레이어만 int8 로 동적 양자화 (CPU 전용, 로딩 시 1초 내외라 디스크 캐시는 하지 않음)
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    _limit_torch_threads()
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return _pipeline(model, tokenizer)
+
+
+# ONNX Runtime ---------------------------------------------------
+def onnx_dir(model_name):
+    return os.path.join(CACHE_DIR, model_name.replace("/", "__"))
+
+
+def export_onnx(model_name, quantize=False):
+    # 최초 1회만 ONNX 그래프를 디스크에 내보내고 이후에는 캐시를 재사용한다
+    # 다른 프로세스가 동시에 내보내도 서로의 임시 파일을 덮지 않게, 프로세스별 임시 파일에 쓰고 바꿔 넣는다
+    target = onnx_dir(model_name)
+    fp32_path = os.path.join(target, "model.onnx")
+    int8_path = os.path.join(target, "model.int8.onnx")
+    path = int8_path if quantize else fp32_path
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(target, exist_ok=True)
+    if not os.path.exists(fp32_path):
+        import torch
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model.eval()
+        tokenizer.save_pretrained(target)
+        model.config.save_pretrained(target)
+
+        sample = tokenizer(["감정 분석 모델 내보내기"], return_tensors="pt")
+        names = list(sample.keys())
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in names}
+        dynamic_axes["logits"] = {0: "batch"}
+        tmp_path = f"{fp32_path}.{os.getpid()}.tmp"
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                tuple(sample[name] for name in names),
+                tmp_path,
+                input_names=names,
+                output_names=["logits"],
+                dynamic_axes=dynamic_axes,
+                opset_version=14,
+            )
+        os.replace(tmp_path, fp32_path)
+
+    if quantize:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        tmp_path = f"{int8_path}.{os.getpid()}.tmp"
+        quantize_dynamic(fp32_path, tmp_path, weight_type=QuantType.QInt8)
+        os.replace(tmp_path, int8_path)
+    return path
+
+
+class OnnxEmotionClassifier:
+    """ONNX Runtime 세션을 transformers pipeline 과 같은 입출력 모양으로 감싼다."""
+
+    def __init__(self, model_dir, model_path, threads=INTRA_OP_THREADS):
+        import onnxruntime as ort
+        from transformers import AutoConfig, AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.id2label = AutoConfig.from_pretrained(model_dir).id2label
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def _run(self, texts, max_length=MAX_LENGTH):
+        encoded = self.tokenizer(texts, padding=True, truncation=True, max_length=max_length, return_tensors="np")
+        feeds = {name: encoded[name].astype(np.int64) for name in self.input_names}
+        logits = self.session.run(["logits"], feeds)[0]
+        logits = logits - logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+        return [
+            [{"label": self.id2label[i], "score": float(p)} for i, p in enumerate(row)]
+            for row in probs
+        ]
+
+    def __call__(self, inputs, batch_size=None, max_length=MAX_LENGTH, **kwargs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        batch_size = batch_size or len(texts)
+        results = []
+        for start in range(0, len(texts), batch_size):
+            results.extend(self._run(texts[start:start + batch_size], max_length))
+        return results
+
+
+def load_onnx(model_name, quantize=False):
+    try:
+        import onnxruntime  # noqa: F401
+    except ImportError:
+        raise RuntimeError("ONNX 백엔드를 쓰려면 onnxruntime 을 설치하세요: pip install onnxruntime")
+    path = export_onnx(model_name, quantize=quantize)
+    return OnnxEmotionClassifier(onnx_dir(model_name), path)
+
+
+BACKENDS = {
+    "torch": load_torch,
+    "int8": load_int8,
+    "onnx": load_onnx,
+    "onnx-int8": lambda model_name: load_onnx(model_name, quantize=True),
+}
+
+
+def load_backend(model_name, backend=None):
+    backend = backend or DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 감정 분류 백엔드입니다: {backend} (가능: {', '.join(BACKENDS)})")
+    return BACKENDS[backend](model_name)
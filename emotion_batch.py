@@ -0,0 +1,114 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+# 마이크로 배치 설정 ---------------------------------------------
+# 여러 세션의 요청을 몇 ms 동안 모아 한 번의 forward pass 로 처리한다
+MAX_BATCH_SIZE = int(os.environ.get("EMOTION_BATCH_MAX_SIZE", 32))
+MAX_WAIT_MS = float(os.environ.get("EMOTION_BATCH_WAIT_MS", 5))
+
+
+class InferenceBatcher:
+    """모든 세션이 공유하는 감정 분류 요청 큐. 요청은 Future 로 결과를 받는다."""
+
+    def __init__(self, classifier, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS, max_in_flight=1, on_wait=None):
+        self.classifier = classifier
+        # 요청이 큐에서 기다린 시간(초)을 알려줄 콜백 (부하에 따른 경량 모드 전환용)
+        self.on_wait = on_wait
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.requests = 0
+        self._queue = queue.Queue()
+        # 워커 풀을 쓰면 워커 수만큼 배치를 동시에 보낸다. 모두 바쁘면 그동안 요청이 더 모인다
+        self._slots = threading.Semaphore(max_in_flight)
+        self._thread = threading.Thread(target=self._run, name="emotion-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, text):
+        future = Future()
+        self._queue.put((text, future, time.monotonic()))
+        return future
+
+    def classify(self, text, timeout=None):
+        return self.submit(text).result(timeout)
+
+    def classify_many(self, texts, timeout=None):
+        # 한꺼번에 넣어 같은 배치로 묶이게 한다. timeout 은 전체에 대한 제한이다
+        futures = [self.submit(text) for text in texts]
+        if timeout is None:
+            return [future.result() for future in futures]
+        deadline = time.monotonic() + timeout
+        return [future.result(max(0.0, deadline - time.monotonic())) for future in futures]
+
+    def _collect(self, batch):
+        # 첫 요청이 올 때까지 기다린 뒤, max_wait 동안 들어오는 요청을 더 모은다
+        batch.append(self._queue.get())
+        end = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            self._slots.acquire()
+            batch = []
+            try:
+                self._dispatch(self._collect(batch))
+            except Exception as e:
+                # 어느 단계에서 실패하든 꺼낸 요청은 실패로 끝내고 자리를 돌려준 뒤 다음 배치로 넘어간다
+                self._fail(batch, e)
+                self._slots.release()
+
+    def _dispatch(self, batch):
+        texts = [text for text, _, _ in batch]
+        if self.on_wait is not None:
+            started = time.monotonic()
+            for _, _, queued_at in batch:
+                self.on_wait(started - queued_at)
+
+        if hasattr(self.classifier, "submit_batch"):
+            # 자리는 워커가 끝낸 뒤 _finish 에서 돌려준다
+            future = self.classifier.submit_batch(texts)
+            future.add_done_callback(lambda done, batch=batch: self._finish(batch, done))
+            return
+
+        results = self.classifier(texts, batch_size=len(texts), truncation=True)
+        self._deliver(batch, results)
+        self._slots.release()
+
+    def _finish(self, batch, done):
+        try:
+            if done.exception() is not None:
+                self._fail(batch, done.exception())
+            else:
+                self._deliver(batch, done.result())
+        finally:
+            self._slots.release()
+
+    def _deliver(self, batch, results):
+        self.batches += 1
+        self.requests += len(batch)
+        for (_, future, _), scores in zip(batch, results):
+            future.set_result(scores)
+
+    def _fail(self, batch, error):
+        for _, future, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "avg_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "queued": self._queue.qsize(),
+        }
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+import streamlit as st
+
+# 감정 분석 결과 캐시 설정 -----------------------------------------
+# 메모리 LRU 가 먼저, 없으면 디스크(SQLite)를 본다. 디스크 캐시는 재시작 후에도 남는다
+# 디스크에는 문장 원문 대신 키의 sha256 만 남기고, 보관 기간(TTL)과 최대 개수를 넘은 것은 지운다
+CACHE_SIZE = int(os.environ.get("EMOTION_CACHE_SIZE", 10000))
+TTL_SECONDS = float(os.environ.get("EMOTION_CACHE_TTL", 30 * 24 * 60 * 60))
+MAX_ENTRIES = int(os.environ.get("EMOTION_CACHE_MAX", 100000))
+PRUNE_EVERY = 100  # 쓰기 100번마다 만료/초과분을 지운다
+CACHE_PATH = os.environ.get(
+    "EMOTION_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".model_cache", "emotion_cache.sqlite3"),
+)
+
+_spaces = re.compile(r"\s+")
+
+
+def normalize_text(text):
+    # 전각/반각, 대소문자, 공백 차이만 있는 문장은 같은 키로 본다
+    text = unicodedata.normalize("NFKC", text)
+    return _spaces.sub(" ", text).strip().casefold()
+
+
+def hash_key(key):
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class EmotionCache:
+    """정규화한 문장 -> 6개 감정 점수 분포. 메모리 LRU + SQLite 디스크 저장소 (키는 sha256 으로만 저장)."""
+
+    def __init__(self, path=CACHE_PATH, max_size=CACHE_SIZE, ttl=TTL_SECONDS, max_entries=MAX_ENTRIES):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # 예전 형식(문장 원문이 키)의 캐시는 원문을 남기지 않도록 통째로 지우고 새로 만든다
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(emotion_cache)")}
+            if columns and "created_at" not in columns:
+                self._db.execute("DROP TABLE emotion_cache")
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS emotion_cache (
+                    key TEXT PRIMARY KEY,
+                    scores TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    used_at REAL NOT NULL
+                )"""
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS emotion_cache_used_at ON emotion_cache (used_at)")
+            self._db.commit()
+
+    def _remember(self, key, scores):
+        self._lru[key] = scores
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    def get(self, key):
+        key = hash_key(key)
+        now = time.time()
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                self.memory_hits += 1
+                return self._lru[key]
+
+            row = None
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT scores FROM emotion_cache WHERE key = ? AND created_at > ?", (key, now - self.ttl)
+                ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._db.execute("UPDATE emotion_cache SET used_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            scores = json.loads(row[0])
+            self._remember(key, scores)
+            self.disk_hits += 1
+            return scores
+
+    def put(self, key, scores):
+        key = hash_key(key)
+        now = time.time()
+        with self._lock:
+            self._remember(key, scores)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO emotion_cache (key, scores, created_at, used_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(scores, ensure_ascii=False), now, now),
+                )
+                self._puts += 1
+                if self._puts % PRUNE_EVERY == 0:
+                    self._prune(now)
+                self._db.commit()
+
+    def _prune(self, now):
+        # 만료된 점수를 지우고, 그래도 넘치면 가장 오래 안 쓰인 것부터 지운다
+        self._db.execute("DELETE FROM emotion_cache WHERE created_at <= ?", (now - self.ttl,))
+        self._db.execute(
+            """DELETE FROM emotion_cache WHERE key IN (
+                SELECT key FROM emotion_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?
+            )""",
+            (self.max_entries,),
+        )
+
+    def stats(self):
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            disk_entries = 0
+            if self._db is not None:
+                disk_entries = self._db.execute("SELECT COUNT(*) FROM emotion_cache").fetchone()[0]
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_entries": len(self._lru),
+                "memory_capacity": self.max_size,
+                "disk_entries": disk_entries,
+                "disk_capacity": self.max_entries,
+                "ttl_seconds": self.ttl,
+            }
+
+
+@st.cache_resource
+def get_emotion_cache():
+    return EmotionCache()
@@ -0,0 +1,197 @@
+"""경량 감정 분류기(문자 n-gram 선형 모델)와 부하에 따른 자동 전환.
+
+KoELECTRA 추론 대기 시간이 예산(EMOTION_SLO_MS)을 넘으면 경량 모델로 바꾸고,
+대기 시간이 충분히 줄어들면 다시 KoELECTRA 로 돌아간다.
+경량 모델은 따로 준비한 문장 파일을 KoELECTRA 로 분류한 점수 분포를 정답 삼아 학습한다.
+(사용자 대화나 감정 분석 캐시는 학습에 쓰지 않는다)
+
+    python emotion_fallback.py --texts corpus.txt    # 한 줄에 한 문장
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+import zlib
+
+import numpy as np
+import streamlit as st
+
+from emotion_cache import normalize_text
+from emotion_model import LABELS
+
+logger = logging.getLogger(__name__)
+
+# 전환 설정 ------------------------------------------------------
+SLO_MS = float(os.environ.get("EMOTION_SLO_MS", 300))
+RECOVER_RATIO = 0.5   # 대기 시간이 예산의 절반 아래로 내려가면 복귀
+PROBE_EVERY = 10      # 경량 모드에서도 10건 중 1건은 KoELECTRA 로 보내 대기 시간을 계속 잰다
+FALLBACK_PATH = os.environ.get(
+    "EMOTION_FALLBACK_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".model_cache", "emotion_fallback.npz"),
+)
+
+TRANSFORMER = "transformer"
+FALLBACK = "fallback"
+
+
+# 문자 n-gram 선형 모델 ----------------------------------------------
+def char_ngrams(text, dim, n_values=(1, 2, 3)):
+    text = f" {normalize_text(text)} "
+    counts = {}
+    for n in n_values:
+        for i in range(len(text) - n + 1):
+            index = zlib.crc32(text[i:i + n].encode("utf-8")) % dim
+            counts[index] = counts.get(index, 0) + 1
+    indices = np.fromiter(counts, dtype=np.int64, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    return indices, values / np.linalg.norm(values)
+
+
+class NgramClassifier:
+    def __init__(self, weights, bias, labels=LABELS):
+        self.weights = weights
+        self.bias = bias
+        self.labels = list(labels)
+        self.dim = weights.shape[0]
+
+    def scores(self, text):
+        indices, values = char_ngrams(text, self.dim)
+        logits = values @ self.weights[indices] + self.bias
+        probs = np.exp(logits - logits.max())
+        probs /= probs.sum()
+        return [{"label": label, "score": float(p)} for label, p in zip(self.labels, probs)]
+
+    def save(self, path=FALLBACK_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez_compressed(path, weights=self.weights, bias=self.bias, labels=np.array(self.labels))
+
+    @classmethod
+    def load(cls, path=FALLBACK_PATH):
+        data = np.load(path)
+        return cls(data["weights"], data["bias"], [str(label) for label in data["labels"]])
+
+    @classmethod
+    def train(cls, texts, targets, dim=2 ** 18, epochs=10, lr=0.5, seed=0):
+        # KoELECTRA 점수 분포를 soft label 로 쓰는 다항 로지스틱 회귀 (SGD)
+        rng = np.random.default_rng(seed)
+        weights = np.zeros((dim, len(LABELS)), dtype=np.float32)
+        bias = np.zeros(len(LABELS), dtype=np.float32)
+        features = [char_ngrams(text, dim) for text in texts]
+        targets = np.asarray(targets, dtype=np.float32)
+
+        for epoch in range(epochs):
+            step = lr / (1 + epoch)
+            for i in rng.permutation(len(features)):
+                indices, values = features[i]
+                logits = values @ weights[indices] + bias
+                probs = np.exp(logits - logits.max())
+                probs /= probs.sum()
+                grad = probs - targets[i]
+                weights[indices] -= step * np.outer(values, grad)
+                bias -= step * grad
+        return cls(weights, bias)
+
+
+# 부하에 따른 전환 -------------------------------------------------
+class DegradationController:
+    """KoELECTRA 큐 대기 시간(지수 이동 평균)을 보고 경량 모드로 전환하거나 복귀한다."""
+
+    def __init__(self, budget_ms=SLO_MS, recover_ratio=RECOVER_RATIO, probe_every=PROBE_EVERY, alpha=0.2):
+        self.budget = budget_ms / 1000
+        self.recover = self.budget * recover_ratio
+        self.probe_every = probe_every
+        self.alpha = alpha
+        self.mode = TRANSFORMER
+        self.wait_ewma = 0.0
+        self.switches = 0
+        self.fallback_requests = 0
+        self.changed_at = time.time()
+        self._requests = 0
+        self._lock = threading.Lock()
+        # observe() 는 배치 스레드에서 불리므로 모델은 여기서 한 번만 읽는다 (읽다 실패하면 전환하지 않는다)
+        self.classifier = None
+        if os.path.exists(FALLBACK_PATH):
+            try:
+                self.classifier = NgramClassifier.load(FALLBACK_PATH)
+            except Exception:
+                logger.exception("경량 감정 모델을 읽지 못했습니다: %s", FALLBACK_PATH)
+
+    def observe(self, wait_seconds):
+        with self._lock:
+            self.wait_ewma = self.alpha * wait_seconds + (1 - self.alpha) * self.wait_ewma
+            if self.mode == TRANSFORMER and self.wait_ewma > self.budget and self.classifier is not None:
+                self._switch(FALLBACK)
+            elif self.mode == FALLBACK and self.wait_ewma < self.recover:
+                self._switch(TRANSFORMER)
+
+    def _switch(self, mode):
+        self.mode = mode
+        self.switches += 1
+        self.changed_at = time.time()
+
+    def use_fallback(self):
+        with self._lock:
+            if self.mode != FALLBACK:
+                return False
+            self._requests += 1
+            if self._requests % self.probe_every == 0:
+                return False
+            self.fallback_requests += 1
+            return True
+
+    def stats(self):
+        return {
+            "mode": self.mode,
+            "wait_ewma_ms": self.wait_ewma * 1000,
+            "budget_ms": self.budget * 1000,
+            "switches": self.switches,
+            "fallback_requests": self.fallback_requests,
+            "fallback_available": self.classifier is not None,
+            "changed_at": self.changed_at,
+        }
+
+
+@st.cache_resource
+def get_degradation_controller():
+    return DegradationController()
+
+
+# 학습 데이터 ----------------------------------------------------
+def labeled_examples(path):
+    # 문장 파일(한 줄에 한 문장)을 KoELECTRA 로 분류해 (정규화한 문장, 점수 분포) 로 만든다
+    from emotion_model import classify_emotion
+
+    with open(path, encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+    texts, targets = [], []
+    for text in lines:
+        distribution = {item["label"]: item["score"] for item in classify_emotion(text)}
+        texts.append(normalize_text(text))
+        targets.append([distribution.get(label, 0.0) for label in LABELS])
+    return texts, targets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경량 감정 분류기 학습")
+    parser.add_argument("--texts", required=True, help="KoELECTRA 로 분류해 학습할 문장 파일 (한 줄에 한 문장)")
+    parser.add_argument("--epochs", type=int, default=10)
+    parser.add_argument("--out", default=FALLBACK_PATH)
+    args = parser.parse_args()
+
+    texts, targets = labeled_examples(args.texts)
+    if not texts:
+        raise SystemExit(f"학습할 문장이 없습니다: {args.texts}")
+
+    model = NgramClassifier.train(texts, targets, epochs=args.epochs)
+    agree = sum(
+        int(np.argmax([item["score"] for item in model.scores(text)]) == int(np.argmax(target)))
+        for text, target in zip(texts, targets)
+    )
+    model.save(args.out)
+    print(f"{len(texts)}개 문장으로 학습, KoELECTRA 와 최고 감정 일치율 {agree / len(texts):.3f} (학습 데이터 기준)")
+    print(f"저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
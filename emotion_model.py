@@ -0,0 +1,190 @@
+import os
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import streamlit as st
+from emotion_batch import InferenceBatcher
+from emotion_backends import DEFAULT_BACKEND
+from emotion_cache import get_emotion_cache, normalize_text
+from emotion_worker import WORKERS, WorkerPool
+
+# 감정 분류 모델 설정 -------------------------------------------
+MODEL_NAME = "Jinuuuu/KoELECTRA_fine_tunning_emotion"
+
+# 모델 준비 상태
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+# 레이블 매핑
+label_map = {
+    "angry": "분노",
+    "happy": "행복",
+    "anxious": "불안",
+    "embarrassed": "당황",
+    "sad": "슬픔",
+    "hurt": "상처"
+}
+LABELS = list(label_map)
+
+# 긴 글(일기 등) 분류 설정: 겹치는 창으로 나눠 한 번에 분류한 뒤 점수를 평균낸다
+WINDOW_CHARS = int(os.environ.get("EMOTION_WINDOW_CHARS", 300))
+WINDOW_OVERLAP = int(os.environ.get("EMOTION_WINDOW_OVERLAP", 50))
+MAX_WINDOWS = int(os.environ.get("EMOTION_MAX_WINDOWS", 8))
+# 워밍업이 실패하면 이 시간(초)이 지난 뒤 다음 방문에서 새로 워밍업한다
+RETRY_SECONDS = float(os.environ.get("EMOTION_RETRY_SECONDS", 60))
+# 요청 하나가 배치 큐에서 결과를 기다리는 최대 시간(초). 넘기면 대화 화면에 오류를 보여 준다
+CLASSIFY_TIMEOUT = float(os.environ.get("EMOTION_CLASSIFY_TIMEOUT", 30))
+
+
+def load_emotion_model(backend=None):
+    # transformers/torch는 무거우니 실제로 모델을 올릴 때만 import
+    # 백엔드(torch / int8 / onnx / onnx-int8)는 EMOTION_BACKEND 환경변수로 고른다
+    from emotion_backends import load_backend
+    return load_backend(MODEL_NAME, backend)
+
+
+# 백그라운드 워밍업 ---------------------------------------------
+class EmotionModel:
+    """감정 분류 모델을 별도 스레드에서 올리고 준비 상태(loading/ready/failed)를 알려준다."""
+
+    def __init__(self, backend=DEFAULT_BACKEND):
+        self.backend = backend
+        self.status = LOADING
+        self.error = None
+        self.failed_at = None
+        self.classifier = None
+        self.batcher = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._load, name="emotion-model-warmup", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _load(self):
+        try:
+            if WORKERS > 0:
+                # 별도 워커 프로세스에서 추론 (이 프로세스는 torch 를 올리지 않는다)
+                self.classifier = WorkerPool(MODEL_NAME, self.backend).start()
+                max_in_flight = self.classifier.workers
+            else:
+                self.classifier = load_emotion_model(self.backend)
+                max_in_flight = 1
+            # 모든 세션의 요청을 모아 배치로 추론하고, 큐 대기 시간은 경량 모드 전환에 쓴다
+            from emotion_fallback import get_degradation_controller
+            self.batcher = InferenceBatcher(
+                self.classifier, max_in_flight=max_in_flight, on_wait=get_degradation_controller().observe
+            )
+            self.status = READY
+        except Exception as e:
+            self.error = e
+            self.failed_at = time.monotonic()
+            self.status = FAILED
+        finally:
+            self._ready.set()
+
+    def wait(self, timeout=None):
+        self._ready.wait(timeout)
+        return self.status
+
+
+@st.cache_resource
+def _emotion_model():
+    # 프로세스당 한 번만 워밍업 스레드를 띄운다
+    return EmotionModel().start()
+
+
+def get_emotion_model():
+    # 실패한 워밍업은 RETRY_SECONDS 가 지나면 버리고 새로 시작한다 (일시적인 다운로드 오류로 대화가 계속 막히지 않게)
+    model = _emotion_model()
+    if model.status == FAILED and time.monotonic() - model.failed_at >= RETRY_SECONDS:
+        retry_emotion_model()
+        model = _emotion_model()
+    return model
+
+
+def retry_emotion_model():
+    _emotion_model.clear()
+
+
+# 긴 글을 겹치는 창으로 나누기
+def split_windows(text, size=WINDOW_CHARS, overlap=WINDOW_OVERLAP, max_windows=MAX_WINDOWS):
+    if len(text) <= size:
+        return [text]
+
+    step = max(1, size - overlap)
+    windows = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        # 가능하면 단어 중간이 아니라 공백에서 자른다
+        if end < len(text):
+            cut = text.rfind(" ", start + step, end)
+            end = cut if cut > start else end
+        windows.append(text[start:end])
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+
+    # 창이 너무 많으면 처음/끝을 포함해 고르게 골라 지연시간을 묶어둔다 (한 개만 쓰면 첫 창)
+    if max_windows <= 1:
+        windows = windows[:1]
+    elif len(windows) > max_windows:
+        picks = [round(i * (len(windows) - 1) / (max_windows - 1)) for i in range(max_windows)]
+        windows = [windows[i] for i in picks]
+    return windows
+
+
+def pool_scores(results, weights):
+    # 창 길이로 가중 평균한 레이블별 점수
+    total = sum(weights)
+    pooled = {}
+    for scores, weight in zip(results, weights):
+        for item in scores:
+            pooled[item["label"]] = pooled.get(item["label"], 0.0) + item["score"] * weight / total
+    return [{"label": label, "score": score} for label, score in pooled.items()]
+
+
+# 감정 분포 계산 (6개 레이블 점수 전체)
+def classify_emotion(text: str, long_input=False):
+    model = get_emotion_model()
+    if model.wait() != READY:
+        raise RuntimeError(f"감정 분석 모델을 불러오지 못했습니다: {model.error}")
+
+    # 같은 문장(정규화 기준)은 캐시된 점수 분포를 그대로 쓴다
+    cache = get_emotion_cache()
+    normalized = normalize_text(text)
+    windows = split_windows(normalized) if long_input else [normalized]
+    key = f"{model.backend}:{'long:' if len(windows) > 1 else ''}{normalized}"
+    scores = cache.get(key)
+    if scores is not None:
+        return scores
+
+    # KoELECTRA 대기 시간이 예산을 넘는 동안에는 경량 분류기로 답한다 (캐시에는 넣지 않음)
+    from emotion_fallback import get_degradation_controller
+    controller = get_degradation_controller()
+    if controller.use_fallback():
+        return controller.classifier.scores(normalized)
+
+    try:
+        if len(windows) > 1:
+            results = model.batcher.classify_many(windows, timeout=CLASSIFY_TIMEOUT)
+            scores = pool_scores(results, [len(window) for window in windows])
+        else:
+            scores = model.batcher.classify(normalized, timeout=CLASSIFY_TIMEOUT)
+    except FutureTimeoutError:
+        raise RuntimeError(f"감정 분석이 {CLASSIFY_TIMEOUT:g}초 안에 끝나지 않았습니다.") from None
+    cache.put(key, scores)
+    return scores
+
+
+# 가장 높은 감정과 점수
+def top_emotion(scores):
+    best = max(scores, key=lambda x: x["score"])
+    return label_map.get(best["label"], best["label"]), best["score"]
+
+
+# 감정 예측 함수
+def predict_emotion(text: str, long_input=False):
+    return top_emotion(classify_emotion(text, long_input))
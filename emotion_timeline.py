@@ -0,0 +1,82 @@
+import threading
+from collections import defaultdict
+from datetime import datetime
+
+import streamlit as st
+from emotion_model import LABELS
+
+# 대화별 / 날짜별 감정 누적 집계 -----------------------------------------
+# 새 메시지 하나가 들어올 때마다 해당 집계만 O(1) 로 갱신한다 (이전 대화는 다시 분류하지 않음)
+# 앱이 다시 뜨면 사용자별로 처음 찾을 때 대화 저장소에 남은 메시지별 점수로 집계를 한 번 다시 만든다
+
+
+class RunningAggregate:
+    def __init__(self):
+        self.count = 0
+        self.sums = dict.fromkeys(LABELS, 0.0)
+        self.last_at = None
+
+    def add(self, scores, at):
+        self.count += 1
+        for item in scores:
+            self.sums[item["label"]] = self.sums.get(item["label"], 0.0) + item["score"]
+        self.last_at = at
+
+    def mean(self):
+        # 레이블별 평균 점수 (0~1)
+        if not self.count:
+            return dict.fromkeys(self.sums, 0.0)
+        return {label: total / self.count for label, total in self.sums.items()}
+
+
+class EmotionTimeline:
+    """사용자별 대화별/날짜별 감정 누적 평균. 메시지 원문과 점수는 남기지 않고 합계만 든다."""
+
+    def __init__(self, store=None):
+        self.store = store
+        self._lock = threading.Lock()
+        self._conversations = defaultdict(lambda: defaultdict(RunningAggregate))
+        self._days = defaultdict(lambda: defaultdict(RunningAggregate))
+        self._seeded = set()
+
+    def _seed(self, user):
+        # 잠금을 잡은 채로 부른다. 사용자마다 처음 한 번만 저장소의 메시지별 점수를 더한다
+        if user in self._seeded:
+            return
+        self._seeded.add(user)
+        if self.store is None:
+            return
+        for conversation_id, ts, scores in self.store.emotion_scores(user):
+            at = datetime.fromtimestamp(ts)
+            self._conversations[user][conversation_id].add(scores, at)
+            self._days[user][at.date()].add(scores, at)
+
+    def record(self, user, conversation_id, scores, at=None):
+        at = at or datetime.now()
+        with self._lock:
+            self._seed(user)
+            self._conversations[user][conversation_id].add(scores, at)
+            self._days[user][at.date()].add(scores, at)
+
+    def conversation(self, user, conversation_id):
+        with self._lock:
+            self._seed(user)
+            aggregate = self._conversations[user].get(conversation_id)
+            return (aggregate.count, aggregate.mean()) if aggregate else (0, None)
+
+    def day(self, user, date):
+        with self._lock:
+            self._seed(user)
+            aggregate = self._days[user].get(date)
+            return (aggregate.count, aggregate.mean()) if aggregate else (0, None)
+
+    def days(self, user):
+        with self._lock:
+            self._seed(user)
+            return {date: aggregate.mean() for date, aggregate in sorted(self._days[user].items())}
+
+
+@st.cache_resource
+def get_emotion_timeline():
+    from chat_store import get_chat_store
+    return EmotionTimeline(get_chat_store())
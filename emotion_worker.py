@@ -0,0 +1,189 @@
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from emotion_backends import DISK_CACHED_BACKENDS
+
+# 감정 분류 워커 프로세스 설정 ----------------------------------------
+# EMOTION_WORKERS=0 이면 기존처럼 Streamlit 프로세스 안에서 추론한다
+WORKERS = int(os.environ.get("EMOTION_WORKERS", 0))
+WORKER_THREADS = int(os.environ.get("EMOTION_WORKER_THREADS", 1))
+CHECK_INTERVAL = 1.0  # 결과가 계속 들어와도 이 간격마다 워커가 살아 있는지 본다
+
+
+def _worker_main(worker_id, model_name, backend, threads, jobs, results):
+    # torch/onnx 가 import 되기 전에 스레드 수를 고정해야 코어를 넘겨 쓰지 않는다
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "EMOTION_INTRA_OP_THREADS"):
+        os.environ[name] = str(threads)
+
+    try:
+        from emotion_backends import load_backend
+        classifier = load_backend(model_name, backend)
+    except Exception as e:
+        results.put(("failed", worker_id, None, repr(e)))
+        return
+    results.put(("ready", worker_id, None, None))
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        job_id, texts = job
+        results.put(("taken", worker_id, job_id, None))
+        try:
+            scores = classifier(texts, batch_size=len(texts), truncation=True)
+            results.put(("done", worker_id, job_id, scores))
+        except Exception as e:
+            results.put(("error", worker_id, job_id, repr(e)))
+
+
+class WorkerPool:
+    """N 개 워커 프로세스 x 프로세스당 M 개 추론 스레드. pipeline 처럼 호출하거나 submit 으로 비동기 요청."""
+
+    def __init__(self, model_name, backend, workers=WORKERS, threads=WORKER_THREADS):
+        self.model_name = model_name
+        self.backend = backend
+        self.workers = max(1, workers)
+        self.threads = max(1, threads)
+        self.restarts = 0
+        self._closed = False
+        self._ctx = mp.get_context("spawn")
+        self._jobs = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._ids = itertools.count()
+        self._pending = {}
+        self._taken = {}
+        self._lock = threading.Lock()
+        self._processes = {}
+        self._broken = {}  # 다시 띄웠는데 모델을 못 올린 워커 -> 오류 (더는 띄우지 않는다)
+        self._started = False
+        self._startup = queue.Queue()
+
+    def start(self, timeout=None):
+        # 모든 워커가 모델을 올릴 때까지 기다린다 (워밍업 스레드에서 호출)
+        threading.Thread(target=self._listen, name="emotion-worker-results", daemon=True).start()
+        # 변환한 모델을 디스크에 써 두는 백엔드는 첫 워커가 다 만든 뒤 나머지가 그 파일을 읽는다
+        first = 1 if self.backend in DISK_CACHED_BACKENDS else self.workers
+        for batch in (range(first), range(first, self.workers)):
+            for worker_id in batch:
+                self._spawn(worker_id)
+            for _ in batch:
+                status, worker_id, error = self._startup.get(timeout=timeout)
+                if status == "failed":
+                    self.close()
+                    raise RuntimeError(f"감정 분석 워커 {worker_id} 시작 실패: {error}")
+        self._started = True
+        return self
+
+    def _spawn(self, worker_id):
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, self.model_name, self.backend, self.threads, self._jobs, self._results),
+            name=f"emotion-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[worker_id] = process
+
+    def submit_batch(self, texts):
+        future = Future()
+        with self._lock:
+            job_id = next(self._ids)
+            self._pending[job_id] = future
+        self._jobs.put((job_id, list(texts)))
+        return future
+
+    def __call__(self, inputs, batch_size=None, **kwargs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        return self.submit_batch(texts).result()
+
+    def _resolve(self, job_id, result=None, error=None):
+        with self._lock:
+            future = self._pending.pop(job_id, None)
+        if future is None:
+            return
+        if error is not None:
+            future.set_exception(RuntimeError(error))
+        else:
+            future.set_result(result)
+
+    def _listen(self):
+        checked = time.monotonic()
+        while True:
+            try:
+                self._handle(*self._results.get(timeout=CHECK_INTERVAL))
+            except queue.Empty:
+                pass
+            if time.monotonic() - checked >= CHECK_INTERVAL:
+                self._check_workers()
+                checked = time.monotonic()
+
+    def _drain(self):
+        # 이미 도착한 결과를 모두 처리한다 (죽은 워커가 마지막으로 보낸 taken/done 을 놓치지 않게)
+        while True:
+            try:
+                self._handle(*self._results.get_nowait())
+            except queue.Empty:
+                return
+
+    def _handle(self, status, worker_id, job_id, payload):
+        if status in ("ready", "failed"):
+            if not self._started:
+                self._startup.put((status, worker_id, payload))
+            elif status == "failed":
+                self._broken[worker_id] = payload
+        elif status == "taken":
+            self._taken[worker_id] = job_id
+        elif status == "done":
+            self._taken.pop(worker_id, None)
+            self._resolve(job_id, result=payload)
+        elif status == "error":
+            self._taken.pop(worker_id, None)
+            self._resolve(job_id, error=payload)
+
+    def _check_workers(self):
+        # 죽은 워커가 처리하던 요청은 실패 처리하고 워커를 다시 띄운다 (시작 중에는 start 가 워커를 띄우므로 보지 않는다)
+        if self._closed or not self._started:
+            return
+        dead = [
+            (worker_id, process) for worker_id, process in self._processes.items()
+            if not process.is_alive() and process.exitcode is not None
+        ]
+        if not dead:
+            return
+        self._drain()
+        for worker_id, process in dead:
+            job_id = self._taken.pop(worker_id, None)
+            if job_id is not None:
+                self._resolve(job_id, error=f"감정 분석 워커 {worker_id} 가 종료되었습니다 (exit {process.exitcode})")
+            if worker_id not in self._broken:
+                self.restarts += 1
+                self._spawn(worker_id)
+
+        # 다시 띄운 워커가 모두 모델을 못 올렸으면 남은 요청을 받을 곳이 없으므로 모두 실패 처리한다
+        if len(self._broken) == self.workers:
+            with self._lock:
+                job_ids = list(self._pending)
+            for job_id in job_ids:
+                self._resolve(job_id, error=f"감정 분석 워커를 다시 띄우지 못했습니다: {next(iter(self._broken.values()))}")
+
+    def close(self):
+        self._closed = True
+        for _ in self._processes:
+            self._jobs.put(None)
+        for process in self._processes.values():
+            process.join(timeout=5)
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "threads_per_worker": self.threads,
+            "alive": sum(process.is_alive() for process in self._processes.values()),
+            "in_flight": len(self._pending),
+            "restarts": self.restarts,
+            "broken": len(self._broken),
+        }
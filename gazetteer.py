@@ -0,0 +1,134 @@
+import csv
+import os
+import re
+from collections import namedtuple
+
+import streamlit as st
+
+from emotion_cache import normalize_text
+
+# 행정구역 지명 사전 설정 ------------------------------------------
+# 시/도, 시/군/구, 읍/면/동 중심 좌표를 메모리 트라이에 올려 "서울시 강남구 역삼동" 같은 입력은 네트워크 없이 바로 찾는다
+GAZETTEER_PATH = os.environ.get(
+    "GAZETTEER_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "gazetteer_kr.csv"),
+)
+SUGGEST_LIMIT = 10
+
+SIDO, SIGUNGU, DONG = 1, 2, 3
+
+Place = namedtuple("Place", ["name", "level", "latitude", "longitude"])
+
+# 자주 쓰는 시/도 줄임말
+SIDO_ALIASES = {
+    "서울특별시": ["서울", "서울시"],
+    "부산광역시": ["부산", "부산시"],
+    "대구광역시": ["대구", "대구시"],
+    "인천광역시": ["인천", "인천시"],
+    "광주광역시": ["광주", "광주시"],
+    "대전광역시": ["대전", "대전시"],
+    "울산광역시": ["울산", "울산시"],
+    "세종특별자치시": ["세종", "세종시"],
+    "경기도": ["경기"],
+    "강원특별자치도": ["강원", "강원도"],
+    "충청북도": ["충북"],
+    "충청남도": ["충남"],
+    "전북특별자치도": ["전북", "전라북도"],
+    "전라남도": ["전남"],
+    "경상북도": ["경북"],
+    "경상남도": ["경남"],
+    "제주특별자치도": ["제주", "제주도"],
+}
+
+# "역삼1동" -> "역삼동" (행정동 번호는 떼고 찾는다)
+_numbered_dong = re.compile(r"^(.+?)\d+동$")
+
+
+def _tokens(text):
+    tokens = normalize_text(text).replace(",", " ").split()
+    return [_numbered_dong.sub(r"\1동", token) for token in tokens]
+
+
+class _Node:
+    __slots__ = ("children", "places", "top")
+
+    def __init__(self):
+        self.children = {}
+        self.places = []  # 이 노드에서 끝나는 키가 가리키는 지명
+        self.top = ()     # 이 노드 아래 지명 중 추천 순서 상위 SUGGEST_LIMIT 개
+
+
+class Gazetteer:
+    """행정구역 이름 -> 중심 좌표. 글자 단위 트라이로 정확히 찾기와 앞부분 추천을 한다."""
+
+    def __init__(self, path=GAZETTEER_PATH):
+        self._root = _Node()
+        self.places = []
+        with open(path, encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                self._add(row["sido"], row["sigungu"], row["dong"], float(row["latitude"]), float(row["longitude"]))
+        self._rank(self._root)
+
+    def _add(self, sido, sigungu, dong, latitude, longitude):
+        parts = [part for part in (sido, sigungu, dong) if part]
+        place = Place(" ".join(parts), len(parts), latitude, longitude)
+        self.places.append(place)
+
+        # 전체 이름뿐 아니라 "강남구 역삼동", "역삼동" 처럼 위 단계를 뺀 이름과 시/도 줄임말로도 찾을 수 있게 한다
+        keys = {" ".join(parts[i:]) for i in range(len(parts))}
+        for alias in SIDO_ALIASES.get(sido, []):
+            keys.add(" ".join([alias] + parts[1:]))
+        for key in keys:
+            self._insert(normalize_text(key), place)
+
+    def _insert(self, key, place):
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+        if place not in node.places:
+            node.places.append(place)
+
+    def _rank(self, node):
+        # 큰 행정구역이 먼저, 같은 단계는 이름순으로 하위 노드의 상위 목록을 합친다
+        candidates = set(node.places)
+        for child in node.children.values():
+            candidates.update(self._rank(child))
+        node.top = tuple(sorted(candidates, key=lambda place: (place.level, place.name))[:SUGGEST_LIMIT])
+        return node.top
+
+    def _find(self, key):
+        node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def lookup(self, text):
+        # 입력 전체가 행정구역 이름과 정확히 같고, 그 이름인 곳이 하나뿐일 때만
+        # ("중구", "광주시" 처럼 여러 곳을 가리키는 이름은 None -> 추천 목록을 보여 준다)
+        node = self._find(" ".join(_tokens(text)))
+        return node.places[0] if node is not None and len(node.places) == 1 else None
+
+    def resolve(self, text):
+        """앞에서부터 가장 길게 맞는 행정구역과, 그 뒤에 남은 (번지/도로명 같은) 토큰을 돌려준다.
+
+        가장 길게 맞는 이름이 여러 곳을 가리키면 어느 곳인지 모르므로 (None, 전체 토큰) 을 돌려준다.
+        """
+        tokens = _tokens(text)
+        for n in range(len(tokens), 0, -1):
+            node = self._find(" ".join(tokens[:n]))
+            if node is not None and node.places:
+                if len(node.places) > 1:
+                    break
+                return node.places[0], tokens[n:]
+        return None, tokens
+
+    def suggest(self, prefix, limit=SUGGEST_LIMIT):
+        node = self._find(" ".join(_tokens(prefix)))
+        return list(node.top[:limit]) if node is not None else []
+
+
+@st.cache_resource
+def get_gazetteer():
+    return Gazetteer()
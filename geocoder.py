@@ -0,0 +1,208 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import streamlit as st
+
+from emotion_cache import normalize_text
+
+# 지오코딩 설정 ---------------------------------------------------
+# 행정구역 이름은 내장 지명 사전에서, 나머지 주소는 캐시(메모리 -> 디스크) -> 외부 서비스 순으로 찾는다
+# 외부 서비스 호출은 프로세스 전체에서 초당 1건으로 묶는다
+BACKEND = os.environ.get("GEOCODER_BACKEND", "nominatim")
+USER_AGENT = os.environ.get("GEOCODER_USER_AGENT", "myGeocoder")
+MIN_INTERVAL = float(os.environ.get("GEOCODER_MIN_INTERVAL", 1.0))  # Nominatim 이용 정책: 초당 1건
+TIMEOUT = float(os.environ.get("GEOCODER_TIMEOUT", 5))
+TTL_SECONDS = float(os.environ.get("GEOCODER_CACHE_TTL", 30 * 24 * 60 * 60))
+NEGATIVE_TTL_SECONDS = float(os.environ.get("GEOCODER_NEGATIVE_TTL", 60 * 60))  # 못 찾은 주소는 짧게만 기억
+MEMORY_SIZE = int(os.environ.get("GEOCODER_MEMORY_SIZE", 2000))
+CACHE_PATH = os.environ.get(
+    "GEOCODER_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".model_cache", "geocode_cache.sqlite3"),
+)
+
+GeoResult = namedtuple("GeoResult", ["latitude", "longitude", "address", "source"])
+
+
+# 외부 지오코더 ---------------------------------------------------
+class NominatimBackend:
+    name = "nominatim"
+
+    def __init__(self):
+        from geopy.geocoders import Nominatim
+        self._geocoder = Nominatim(user_agent=USER_AGENT, timeout=TIMEOUT)
+
+    def geocode(self, query):
+        location = self._geocoder.geocode(query, country_codes="kr", language="ko")
+        if location is None:
+            return None
+        return GeoResult(location.latitude, location.longitude, location.address, self.name)
+
+
+# 이름 -> 백엔드 생성 함수. 테스트에서는 여기에 가짜 백엔드를 넣거나 Geocoder(backend=...) 로 넘긴다
+BACKENDS = {
+    "nominatim": NominatimBackend,
+}
+
+
+class RateLimiter:
+    """호출 사이 최소 간격을 지키게 한다 (프로세스 전체에서 하나). with 블록 안에서 wait() 후 호출한다."""
+
+    def __init__(self, min_interval=MIN_INTERVAL):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._last_call = 0.0
+
+    def __enter__(self):
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self._lock.release()
+
+    def wait(self):
+        delay = self._last_call + self.min_interval - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._last_call = time.monotonic()
+
+
+class Geocoder:
+    """정규화한 주소 -> 좌표. 지명 사전 + 메모리 LRU + SQLite 캐시(TTL) + 호출량 제한이 걸린 외부 백엔드."""
+
+    def __init__(self, backend=None, path=CACHE_PATH, limiter=None, gazetteer=None):
+        self.backend = backend if backend is not None else BACKENDS[BACKEND]()
+        self.limiter = limiter or RateLimiter()
+        self.gazetteer = gazetteer
+        self.gazetteer_hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.lookups = 0
+        self.errors = 0
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS geocode_cache (
+                    query TEXT PRIMARY KEY,
+                    latitude REAL,
+                    longitude REAL,
+                    address TEXT,
+                    created_at REAL NOT NULL
+                )"""
+            )
+            self._db.commit()
+
+    def _remember(self, key, result, expires_at):
+        self._lru[key] = (result, expires_at)
+        self._lru.move_to_end(key)
+        while len(self._lru) > MEMORY_SIZE:
+            self._lru.popitem(last=False)
+
+    def _cached(self, key):
+        # 캐시에 있으면 (True, 결과 또는 None), 없으면 (False, None)
+        now = time.time()
+        with self._lock:
+            if key in self._lru:
+                result, expires_at = self._lru[key]
+                if expires_at > now:
+                    self._lru.move_to_end(key)
+                    self.memory_hits += 1
+                    return True, result
+                del self._lru[key]
+
+            if self._db is None:
+                return False, None
+            row = self._db.execute(
+                "SELECT latitude, longitude, address, created_at FROM geocode_cache WHERE query = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+            latitude, longitude, address, created_at = row
+            result = None if latitude is None else GeoResult(latitude, longitude, address, "cache")
+            expires_at = created_at + (TTL_SECONDS if result else NEGATIVE_TTL_SECONDS)
+            if expires_at <= now:
+                return False, None
+            self._remember(key, result, expires_at)
+            self.disk_hits += 1
+            return True, result
+
+    def _store(self, key, result):
+        now = time.time()
+        with self._lock:
+            ttl = TTL_SECONDS if result else NEGATIVE_TTL_SECONDS
+            self._remember(key, result and result._replace(source="cache"), now + ttl)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO geocode_cache (query, latitude, longitude, address, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, *(result[:3] if result else (None, None, None)), now),
+                )
+                self._db.commit()
+
+    def geocode(self, query):
+        # "서울시 강남구 역삼동" 처럼 행정구역 이름뿐이면 지명 사전으로 끝낸다 ("중구" 처럼 여러 곳인 이름은 외부 지오코더로)
+        place, rest = self.gazetteer.resolve(query) if self.gazetteer is not None else (None, None)
+        if place is not None and not rest:
+            self.gazetteer_hits += 1
+            return GeoResult(place.latitude, place.longitude, place.name, "gazetteer")
+
+        # 번지/도로명까지 있는 주소는 외부 지오코더로, 거기서 못 찾으면 앞부분 행정구역 중심으로 대신한다
+        try:
+            result = self._geocode_external(query)
+        except Exception:
+            if place is None:
+                raise
+            result = None
+        if result is None and place is not None:
+            self.gazetteer_hits += 1
+            return GeoResult(place.latitude, place.longitude, place.name, "gazetteer")
+        return result
+
+    def _geocode_external(self, query):
+        key = normalize_text(query)
+        if not key:
+            return None
+        found, result = self._cached(key)
+        if found:
+            return result
+
+        with self.limiter:
+            # 기다리는 동안 다른 세션이 같은 주소를 찾았을 수 있다
+            found, result = self._cached(key)
+            if found:
+                return result
+            self.limiter.wait()
+            self.lookups += 1
+            try:
+                result = self.backend.geocode(query)
+            except Exception:
+                self.errors += 1
+                raise
+        self._store(key, result)
+        return result
+
+    def stats(self):
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM geocode_cache").fetchone()[0] if self._db else 0
+        return {
+            "backend": getattr(self.backend, "name", type(self.backend).__name__),
+            "gazetteer_hits": self.gazetteer_hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "lookups": self.lookups,
+            "errors": self.errors,
+            "memory_entries": len(self._lru),
+            "disk_entries": entries,
+        }
+
+
+@st.cache_resource
+def get_geocoder():
+    from gazetteer import get_gazetteer
+    return Geocoder(gazetteer=get_gazetteer())
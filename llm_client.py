@@ -0,0 +1,129 @@
+import os
+import threading
+
+import httpx
+import streamlit as st
+
+# OpenAI 클라이언트 설정 ------------------------------------------
+# 모든 세션이 클라이언트 하나(연결 풀 하나)를 같이 써서 keep-alive / TLS 세션을 재사용한다
+MAX_CONNECTIONS = int(os.environ.get("OPENAI_MAX_CONNECTIONS", 50))
+MAX_KEEPALIVE = int(os.environ.get("OPENAI_MAX_KEEPALIVE", 20))
+KEEPALIVE_EXPIRY = float(os.environ.get("OPENAI_KEEPALIVE_EXPIRY", 60))
+CONNECT_TIMEOUT = float(os.environ.get("OPENAI_CONNECT_TIMEOUT", 5))
+READ_TIMEOUT = float(os.environ.get("OPENAI_TIMEOUT", 60))
+DRAIN_BYTES = 64 * 1024  # 스트림을 닫을 때 이만큼까지만 남은 본문을 마저 읽는다
+
+
+class DrainingStream(httpx.SyncByteStream):
+    """SSE 응답을 "[DONE]" 뒤에 닫을 때 남은 본문(마지막 빈 청크)을 마저 읽는다.
+
+    openai SDK 는 "[DONE]" 을 받자마자 응답을 닫는데, 그때 본문 끝이 아직 읽히지 않았으면
+    httpcore 가 연결을 풀에 돌려주지 않고 끊는다. 중간에 끊긴 스트림은 읽지 않고 바로 닫는다.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._parts = None
+        self._tail = b""
+
+    def __iter__(self):
+        self._parts = iter(self._stream)
+        for part in self._parts:
+            self._tail = (self._tail + part)[-32:]
+            yield part
+
+    def close(self):
+        if self._parts is not None and b"[DONE]" in self._tail:
+            drained = 0
+            try:
+                for part in self._parts:
+                    drained += len(part)
+                    if drained > DRAIN_BYTES:
+                        break
+            except httpx.HTTPError:
+                pass
+        self._stream.close()
+
+
+class DrainingTransport(httpx.HTTPTransport):
+    def handle_request(self, request):
+        response = super().handle_request(request)
+        response.stream = DrainingStream(response.stream)
+        return response
+
+
+class ConnectionStats:
+    """요청마다 새 TCP/TLS 연결을 열었는지, 풀의 연결을 재사용했는지 센다."""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self._lock = threading.Lock()
+
+    def on_request(self, request):
+        state = {"connected": False, "tls": False}
+
+        def trace(event, info):
+            # httpcore 가 새 연결을 맺을 때만 connect_tcp / start_tls 이벤트가 온다
+            if event == "connection.connect_tcp.complete":
+                state["connected"] = True
+            elif event == "connection.start_tls.complete":
+                state["tls"] = True
+
+        request.extensions["trace"] = trace
+        request.connection_state = state
+
+    def on_response(self, response):
+        state = getattr(response.request, "connection_state", None)
+        if state is None:
+            return
+        with self._lock:
+            self.requests += 1
+            self.new_connections += state["connected"]
+            self.tls_handshakes += state["tls"]
+
+    def stats(self):
+        with self._lock:
+            reused = self.requests - self.new_connections
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": reused,
+                "reuse_rate": reused / self.requests if self.requests else 0.0,
+                "tls_handshakes": self.tls_handshakes,
+            }
+
+
+@st.cache_resource
+def get_connection_stats():
+    return ConnectionStats()
+
+
+def _api_key():
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    try:
+        return st.secrets["OPENAI_API_KEY"]
+    except (KeyError, FileNotFoundError):
+        return os.environ["OPENAI_API_KEY"]
+
+
+@st.cache_resource
+def get_openai_client():
+    # 프로세스당 한 번만 만든다 (rerun 마다 새로 만들면 연결을 매번 새로 맺는다)
+    from openai import OpenAI
+
+    stats = get_connection_stats()
+    http_client = httpx.Client(
+        transport=DrainingTransport(limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )),
+        timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        event_hooks={"request": [stats.on_request], "response": [stats.on_response]},
+    )
+    # 재시도는 llm_limiter 가 대기열을 거쳐 한다 (LLM_429_RETRIES). SDK 자체 재시도는 쓰지 않는다
+    return OpenAI(api_key=_api_key(), http_client=http_client, max_retries=0)
@@ -0,0 +1,165 @@
+import os
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+
+import streamlit as st
+
+# LLM 호출 입장 제어 설정 -------------------------------------------
+# 프로세스 전체에서 초당 호출 수를 토큰 버킷으로 묶고, 넘치는 요청은 사용자별로 번갈아 줄 세운다
+RATE_PER_SEC = float(os.environ.get("LLM_RATE_PER_SEC", 5))
+BURST = int(os.environ.get("LLM_BURST", 10))
+MAX_QUEUE = int(os.environ.get("LLM_QUEUE_MAX", 50))
+MAX_RETRIES = int(os.environ.get("LLM_429_RETRIES", 3))
+BACKOFF_BASE = float(os.environ.get("LLM_BACKOFF_BASE", 0.5))
+
+
+class LLMBusyError(RuntimeError):
+    """대기열이 가득 차서 요청을 받을 수 없을 때."""
+
+
+def retryable(error):
+    # SDK 가 재시도하던 것과 같은 기준: 408/409/429/5xx 응답과 연결 오류(타임아웃 포함)
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status in (408, 409, 429) or status >= 500
+    return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+
+class Ticket:
+    def __init__(self, user):
+        self.user = user
+        self.granted = threading.Event()
+        self.cancelled = False
+
+
+class AdmissionController:
+    """토큰 버킷 + 크기 제한 대기열 + 사용자별 라운드로빈."""
+
+    def __init__(self, rate=RATE_PER_SEC, burst=BURST, max_queue=MAX_QUEUE):
+        self.rate = rate
+        self.burst = burst
+        self.max_queue = max_queue
+        self.tokens = float(burst)
+        self.admitted = 0
+        self.rejected = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self._refilled_at = time.monotonic()
+        self._queues = OrderedDict()  # 사용자 -> 대기 중인 Ticket 들 (순서 = 라운드로빈 순서)
+        self._waiting = 0
+        self._cond = threading.Condition()
+        threading.Thread(target=self._dispatch, name="llm-admission", daemon=True).start()
+
+    # 대기열 -------------------------------------------------------
+    def enter(self, user):
+        with self._cond:
+            if self._waiting >= self.max_queue:
+                self.rejected += 1
+                raise LLMBusyError("상담 요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.")
+            ticket = Ticket(user)
+            self._queues.setdefault(user, deque()).append(ticket)
+            self._waiting += 1
+            self._cond.notify_all()
+            return ticket
+
+    def leave(self, ticket):
+        with self._cond:
+            if ticket.granted.is_set() or ticket.cancelled:
+                return
+            ticket.cancelled = True
+            self._queues[ticket.user].remove(ticket)
+            if not self._queues[ticket.user]:
+                del self._queues[ticket.user]
+            self._waiting -= 1
+
+    def position(self, ticket):
+        # 라운드로빈 순서대로 몇 번째로 처리될지 (1 부터)
+        with self._cond:
+            if ticket.granted.is_set():
+                return 0
+            users = list(self._queues.items())
+            depth = max((len(tickets) for _, tickets in users), default=0)
+            order = 0
+            for round_index in range(depth):
+                for _, tickets in users:
+                    if round_index < len(tickets):
+                        order += 1
+                        if tickets[round_index] is ticket:
+                            return order
+            return order
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _dispatch(self):
+        with self._cond:
+            while True:
+                self._refill()
+                while self._queues and self.tokens >= 1:
+                    # 맨 앞 사용자의 요청 하나를 통과시키고 그 사용자는 줄 맨 뒤로 보낸다
+                    user, tickets = next(iter(self._queues.items()))
+                    ticket = tickets.popleft()
+                    del self._queues[user]
+                    if tickets:
+                        self._queues[user] = tickets
+                    self._waiting -= 1
+                    self.tokens -= 1
+                    self.admitted += 1
+                    ticket.granted.set()
+
+                if self._queues:
+                    self._cond.wait((1 - self.tokens) / self.rate)
+                else:
+                    self._cond.wait()
+
+    # 호출 ---------------------------------------------------------
+    def call(self, user, client, request, on_wait=None, poll=0.5):
+        """입장 허가를 받은 뒤 request(client) 를 실행한다.
+
+        재시도는 여기서만 한다: SDK 자체 재시도는 끄고(max_retries=0), 429/5xx/연결 오류를 받으면
+        지터를 섞어 물러났다가 다시 줄을 선다 (재시도도 토큰 버킷을 거친다).
+        """
+        client = client.with_options(max_retries=0)
+        for attempt in range(MAX_RETRIES + 1):
+            ticket = self.enter(user)
+            try:
+                while not ticket.granted.wait(poll):
+                    if on_wait is not None:
+                        on_wait(self.position(ticket))
+            except BaseException:
+                self.leave(ticket)
+                raise
+
+            try:
+                return request(client)
+            except Exception as e:
+                if not retryable(e) or attempt == MAX_RETRIES:
+                    raise
+                with self._cond:
+                    self.rate_limited += getattr(e, "status_code", None) == 429
+                    self.retries += 1
+                time.sleep(BACKOFF_BASE * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    def stats(self):
+        with self._cond:
+            self._refill()
+            return {
+                "waiting": self._waiting,
+                "users_waiting": len(self._queues),
+                "max_queue": self.max_queue,
+                "tokens": self.tokens,
+                "rate_per_sec": self.rate,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "rate_limited": self.rate_limited,
+                "retries": self.retries,
+            }
+
+
+@st.cache_resource
+def get_llm_limiter():
+    return AdmissionController()
@@ -0,0 +1,138 @@
+import csv
+import heapq
+import os
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+# 병원 평점 순위 설정 ----------------------------------------------
+# 평점은 베이지안 평균으로 보정하고, 지역(시/도, 시/군/구)별 상위 K 개 목록을 미리 만들어 두었다가 꺼내 쓴다
+RATINGS_PATH = os.environ.get(
+    "RATINGS_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".chat_data", "clinic_ratings.sqlite3"),
+)
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "clinic_ratings_sample.csv")
+PRIOR_WEIGHT = float(os.environ.get("RATINGS_PRIOR_WEIGHT", 5))  # 평가가 이만큼 쌓이기 전에는 전체 평균 쪽으로 당긴다
+TOP_K = int(os.environ.get("RATINGS_TOP_K", 10))
+REBUILD_SECONDS = float(os.environ.get("RATINGS_REBUILD_SECONDS", 60 * 60))
+
+
+class RatingRanker:
+    """병원별 (평가 수, 합계) 를 메모리에 들고, 평가가 추가되면 그 병원이 속한 지역 목록만 다시 만든다."""
+
+    def __init__(self, clinics, path=RATINGS_PATH, sample_path=SAMPLE_PATH, top_k=TOP_K):
+        self.clinics = clinics
+        self.top_k = top_k
+        self.prior_mean = 0.0
+        self.rebuilt_at = 0.0
+        self._lock = threading.Lock()
+        self._row_of = {clinic_id: i for i, clinic_id in enumerate(clinics["clinic_id"])}
+        self._regions_of = {}
+        self._members = {}
+        for clinic_id, sido, sigungu in zip(clinics["clinic_id"], clinics["sido"], clinics["sigungu"]):
+            regions = ((sido, ""), (sido, sigungu))
+            self._regions_of[clinic_id] = regions
+            for region in regions:
+                self._members.setdefault(region, []).append(clinic_id)
+        self._stats = {}  # clinic_id -> [평가 수, 합계]
+        self._top = {}    # (시/도, 시/군/구) -> [(점수, clinic_id), ...]
+        self._frames = {}  # 지역 -> top() 결과 DataFrame (목록이 바뀌면 지운다)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS clinic_ratings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                clinic_id TEXT NOT NULL,
+                user TEXT NOT NULL,
+                rating INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS clinic_ratings_clinic ON clinic_ratings (clinic_id)")
+        self._db.commit()
+        empty = self._db.execute("SELECT 1 FROM clinic_ratings LIMIT 1").fetchone() is None
+        if empty and sample_path and os.path.exists(sample_path):
+            self._import(sample_path)
+        self.rebuild()
+
+    def _import(self, path):
+        # 처음 만들 때만 예시 평점을 넣어 둔다 (예시 병원 목록을 쓸 때, 그 목록에 있는 병원 것만)
+        with open(path, encoding="utf-8") as f:
+            rows = [
+                (r["clinic_id"], r["user"], int(r["rating"]), float(r["created_at"]))
+                for r in csv.DictReader(f) if r["clinic_id"] in self._row_of
+            ]
+        self._db.executemany("INSERT INTO clinic_ratings (clinic_id, user, rating, created_at) VALUES (?, ?, ?, ?)", rows)
+        self._db.commit()
+
+    def _score(self, clinic_id):
+        count, total = self._stats[clinic_id]
+        return (PRIOR_WEIGHT * self.prior_mean + total) / (PRIOR_WEIGHT + count)
+
+    def _rank_region(self, region):
+        rated = [clinic_id for clinic_id in self._members.get(region, ()) if clinic_id in self._stats]
+        self._top[region] = heapq.nlargest(self.top_k, ((self._score(c), c) for c in rated))
+        self._frames.pop(region, None)
+
+    def rebuild(self):
+        """전체 평균(사전 평균)을 다시 구하고 모든 지역 목록을 새로 만든다."""
+        with self._lock:
+            rows = self._db.execute("SELECT clinic_id, COUNT(*), SUM(rating) FROM clinic_ratings GROUP BY clinic_id").fetchall()
+            self._stats = {clinic_id: [count, total] for clinic_id, count, total in rows if clinic_id in self._row_of}
+            count = sum(count for count, _ in self._stats.values())
+            self.prior_mean = sum(total for _, total in self._stats.values()) / count if count else 0.0
+            for region in self._members:
+                self._rank_region(region)
+            self.rebuilt_at = time.time()
+
+    def add_rating(self, clinic_id, user, rating):
+        # 새 평가는 그 병원의 합계만 고치고, 병원이 속한 두 지역 목록만 다시 순위를 매긴다
+        if time.time() - self.rebuilt_at > REBUILD_SECONDS:
+            self.rebuild()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO clinic_ratings (clinic_id, user, rating, created_at) VALUES (?, ?, ?, ?)",
+                (clinic_id, user, int(rating), time.time()),
+            )
+            self._db.commit()
+            stats = self._stats.setdefault(clinic_id, [0, 0])
+            stats[0] += 1
+            stats[1] += int(rating)
+            for region in self._regions_of.get(clinic_id, ()):
+                self._rank_region(region)
+
+    def top(self, sido, sigungu="", k=None):
+        """미리 만든 지역별 상위 목록을 그대로 꺼낸다 (병원 정보 + score, ratings, average 열)."""
+        region = (sido, sigungu or "")
+        with self._lock:
+            frame = self._frames.get(region)
+            if frame is None:
+                ranked = self._top.get(region, [])
+                counts = [self._stats[clinic_id] for _, clinic_id in ranked]
+                frame = self.clinics.iloc[[self._row_of[clinic_id] for _, clinic_id in ranked]].copy()
+                frame["score"] = [score for score, _ in ranked]
+                frame["ratings"] = [count for count, _ in counts]
+                frame["average"] = [total / count for count, total in counts]
+                self._frames[region] = frame
+        return frame.head(k or self.top_k)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "rated_clinics": len(self._stats),
+                "ratings": sum(count for count, _ in self._stats.values()),
+                "prior_mean": self.prior_mean,
+                "regions": len(self._top),
+                "rebuilt_at": self.rebuilt_at,
+            }
+
+
+@st.cache_resource
+def get_rating_ranker():
+    from clinics import get_clinic_index, using_sample_data
+    # 예시 평점은 예시 병원 목록(clinic_id 가 같은 가상 데이터)에만 넣는다
+    return RatingRanker(get_clinic_index().clinics, sample_path=SAMPLE_PATH if using_sample_data() else None)
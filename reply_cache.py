@@ -0,0 +1,111 @@
+import os
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+from emotion_cache import normalize_text
+
+# 상담 답변 캐시 설정 ---------------------------------------------
+# (정규화한 입력, 감정, 신뢰도 구간)이 같으면 LLM 을 부르지 않고 저장된 답변을 쓴다. 기본은 꺼짐
+ENABLED = os.environ.get("REPLY_CACHE_ENABLED", "0").lower() in ("1", "true", "yes")
+TTL_SECONDS = float(os.environ.get("REPLY_CACHE_TTL", 24 * 60 * 60))
+MAX_ENTRIES = int(os.environ.get("REPLY_CACHE_MAX", 5000))
+CACHE_PATH = os.environ.get(
+    "REPLY_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".model_cache", "reply_cache.sqlite3"),
+)
+
+
+def confidence_band(score):
+    # 프롬프트가 0.6 미만이면 되묻도록 하므로 그 경계를 기준으로 나눈다
+    if score < 0.6:
+        return "low"
+    if score < 0.85:
+        return "mid"
+    return "high"
+
+
+def reply_key(text, emotion, score):
+    return f"{emotion}|{confidence_band(score)}|{normalize_text(text)}"
+
+
+class ReplyCache:
+    """상담 답변 디스크 캐시 (TTL, 최대 개수, 키별 적중 횟수)."""
+
+    def __init__(self, path=CACHE_PATH, ttl=TTL_SECONDS, max_entries=MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS reply_cache (
+                key TEXT PRIMARY KEY,
+                answer TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                last_hit_at REAL
+            )"""
+        )
+        self._db.commit()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT answer FROM reply_cache WHERE key = ? AND created_at > ?", (key, now - self.ttl)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE reply_cache SET hits = hits + 1, last_hit_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, answer):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO reply_cache (key, answer, created_at, hits, last_hit_at) VALUES (?, ?, ?, 0, NULL)",
+                (key, answer, now),
+            )
+            # 만료된 답변을 지우고, 그래도 넘치면 가장 오래 안 쓰인 것부터 지운다
+            self._db.execute("DELETE FROM reply_cache WHERE created_at <= ?", (now - self.ttl,))
+            self._db.execute(
+                """DELETE FROM reply_cache WHERE key IN (
+                    SELECT key FROM reply_cache ORDER BY COALESCE(last_hit_at, created_at) DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_entries,),
+            )
+            self._db.commit()
+
+    def top_keys(self, limit=10):
+        with self._lock:
+            return self._db.execute(
+                "SELECT key, hits, created_at, last_hit_at FROM reply_cache ORDER BY hits DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+    def stats(self):
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM reply_cache").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "enabled": ENABLED,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+            }
+
+
+@st.cache_resource
+def get_reply_cache():
+    return ReplyCache()
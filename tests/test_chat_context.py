@@ -0,0 +1,56 @@
+import pytest
+
+import chat_context
+from chat_context import ConversationContext, message_tokens
+
+
+def make_history(turns):
+    history = [{"role": "bot", "message": "안녕하세요!"}]
+    for i in range(turns):
+        history.append({"role": "user", "message": f"질문 {i} " + "가" * 40})
+        history.append({"role": "bot", "message": f"답변 {i} " + "나" * 40})
+    return history
+
+
+def test_spill_keeps_greeting_and_newest():
+    context = ConversationContext()
+    context.summarized_upto = 9
+    history = make_history(5)
+    newest = history[-3:]
+
+    spilled = context.spill(history, 4)
+    assert [chat["message"] for chat in spilled] == [chat["message"] for chat in make_history(5)[1:8]]
+    assert history[0]["message"] == "안녕하세요!"
+    assert history[1:] == newest
+    assert (context.summarized_upto, context.spilled) == (2, 7)
+
+    assert context.spill(history, 4) == []
+    assert context.spilled == 7
+
+
+@pytest.mark.parametrize("spare", [3000, 200, 40])
+def test_build_messages_stays_within_budget(monkeypatch, spare):
+    # 고정 지시문 몫을 뺀 나머지(spare)가 넉넉할 때/최근 턴 일부만 들어갈 때/최근 턴은 하나도 못 넣을 때
+    budget = message_tokens({"content": chat_context.SYSTEM_PROMPT}) + spare
+    monkeypatch.setattr(chat_context, "TOKEN_BUDGET", budget)
+    context = ConversationContext()
+    context.summary = "이전 요약 " * 30
+    history = make_history(6)
+    history.append({"role": "user", "message": "이번 메시지"})
+
+    messages = context.build_messages(history, "이번 메시지 프롬프트")
+    assert sum(message_tokens(m) for m in messages) <= budget
+    assert messages[0]["content"] == chat_context.SYSTEM_PROMPT
+    assert messages[-1] == {"role": "user", "content": "이번 메시지 프롬프트"}
+
+    # 최근 턴은 예산이 모자라면 오래된 것부터 빠진다 (남는 것은 언제나 가장 최근 쪽)
+    recent = [m["content"] for m in messages[1:-1] if m["role"] != "system"]
+    previous = [chat["message"] for chat in history[:-1]][-chat_context.RECENT_TURNS * 2:]
+    assert recent == previous[len(previous) - len(recent):]
+    if spare == 3000:
+        assert recent == previous
+        assert messages[1]["content"].startswith("이전 대화 요약: ")
+    elif spare == 200:
+        assert 0 < len(recent) < len(previous)
+    else:
+        assert recent == []
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from clinics import ClinicIndex, haversine_km
+
+
+@pytest.fixture(scope="module")
+def clinics():
+    # 서울 근처에 몰린 병원 + 전국에 흩어진 병원 (격자 칸마다 밀도가 다르게)
+    rng = np.random.default_rng(0)
+    lats = np.concatenate([rng.normal(37.55, 0.05, 400), rng.uniform(33.2, 38.5, 300)])
+    lons = np.concatenate([rng.normal(126.98, 0.05, 400), rng.uniform(126.0, 129.5, 300)])
+    return pd.DataFrame({
+        "clinic_id": [f"C{i:06d}" for i in range(len(lats))],
+        "name": [f"병원 {i}" for i in range(len(lats))],
+        "latitude": lats,
+        "longitude": lons,
+    })
+
+
+def brute_force(clinics, lat, lon, k):
+    distances = haversine_km(lat, lon, clinics["latitude"].to_numpy(), clinics["longitude"].to_numpy())
+    order = np.argsort(distances, kind="stable")[:k]
+    return order, distances[order]
+
+
+@pytest.mark.parametrize("lat, lon", [
+    (37.55, 126.98),   # 병원이 몰린 곳
+    (35.18, 129.08),   # 드문 곳
+    (33.0, 125.5),     # 모든 병원 바깥
+    (38.9, 131.0),
+])
+@pytest.mark.parametrize("k", [1, 10, 50])
+@pytest.mark.parametrize("grid", [0.01, 0.05, 0.5])
+def test_nearest_matches_brute_force(clinics, lat, lon, k, grid):
+    index = ClinicIndex(clinics, grid_degrees=grid)
+    ids, distances = index.nearest_ids(lat, lon, k)
+    expected_ids, expected = brute_force(clinics, lat, lon, k)
+    assert list(ids) == list(expected_ids)
+    np.testing.assert_allclose(distances, expected)
+
+
+def test_nearest_with_more_than_available(clinics):
+    index = ClinicIndex(clinics.head(3))
+    ids, distances = index.nearest_ids(37.55, 126.98, 10)
+    assert sorted(ids) == [0, 1, 2]
+    assert list(distances) == sorted(distances)
+
+    empty = ClinicIndex(clinics.head(0))
+    assert len(empty.nearest_ids(37.55, 126.98, 10)[0]) == 0
@@ -0,0 +1,41 @@
+from concurrent.futures import Future
+
+import pytest
+
+from emotion_batch import InferenceBatcher
+
+SCORES = [{"label": "sad", "score": 1.0}]
+
+
+class FlakyClassifier:
+    """"fail" 이 든 배치는 예외를 낸다 (pipeline 처럼 호출)."""
+
+    def __call__(self, texts, batch_size=None, **kwargs):
+        if "fail" in texts:
+            raise ValueError("추론 실패")
+        return [SCORES for _ in texts]
+
+
+class FlakyPool(FlakyClassifier):
+    """워커 풀처럼 submit_batch 로 Future 를 돌려준다."""
+
+    def submit_batch(self, texts):
+        future = Future()
+        try:
+            future.set_result(self(texts))
+        except ValueError as e:
+            future.set_exception(e)
+        return future
+
+
+@pytest.mark.parametrize("classifier", [FlakyClassifier(), FlakyPool()])
+def test_errors_reach_every_caller_and_batcher_keeps_going(classifier):
+    batcher = InferenceBatcher(classifier, max_wait_ms=50, max_in_flight=1)
+    futures = [batcher.submit(text) for text in ["ok", "fail", "ok"]]
+    for future in futures:
+        with pytest.raises(ValueError, match="추론 실패"):
+            future.result(timeout=5)
+
+    # 실패한 배치가 자리를 돌려줬으므로 다음 요청은 처리된다
+    assert batcher.classify("ok", timeout=5) == SCORES
+    assert batcher.classify_many(["ok", "ok"], timeout=5) == [SCORES, SCORES]
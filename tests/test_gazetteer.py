@@ -0,0 +1,65 @@
+import pytest
+
+from gazetteer import Gazetteer
+from geocoder import GeoResult, Geocoder, RateLimiter
+
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return Gazetteer()
+
+
+class FakeBackend:
+    name = "fake"
+
+    def __init__(self):
+        self.queries = []
+
+    def geocode(self, query):
+        self.queries.append(query)
+        return GeoResult(35.0, 128.0, f"외부: {query}", self.name)
+
+
+@pytest.mark.parametrize("name", ["광주시", "중구", "서구", "동구", "남구", "북구", "강서구", "고성군"])
+def test_ambiguous_names_are_not_resolved(gazetteer, name):
+    assert gazetteer.lookup(name) is None
+    place, rest = gazetteer.resolve(name)
+    assert place is None
+    assert len(gazetteer.suggest(name)) > 1
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("광주", "광주광역시"),
+    ("광주광역시", "광주광역시"),
+    ("경기 광주시", "경기도 광주시"),
+    ("서울 중구", "서울특별시 중구"),
+    ("부산 북구", "부산광역시 북구"),
+    ("서울시 강남구 역삼1동", "서울특별시 강남구 역삼동"),
+    ("역삼동", "서울특별시 강남구 역삼동"),
+])
+def test_unique_names_resolve(gazetteer, text, expected):
+    assert gazetteer.lookup(text).name == expected
+    place, rest = gazetteer.resolve(text)
+    assert (place.name, rest) == (expected, [])
+
+
+def test_ambiguous_prefix_keeps_all_tokens(gazetteer):
+    assert gazetteer.resolve("중구 세종대로 110") == (None, ["중구", "세종대로", "110"])
+
+
+def test_suggestions_cover_every_match(gazetteer):
+    names = {place.name for place in gazetteer.suggest("광주시")}
+    assert {"광주광역시", "경기도 광주시"} <= names
+
+
+def test_geocoder_sends_ambiguous_names_to_backend(gazetteer):
+    backend = FakeBackend()
+    geocoder = Geocoder(backend=backend, path=None, limiter=RateLimiter(0), gazetteer=gazetteer)
+
+    result = geocoder.geocode("중구")
+    assert result.source == "fake"
+    assert backend.queries == ["중구"]
+
+    result = geocoder.geocode("서울 중구")
+    assert (result.address, result.source) == ("서울특별시 중구", "gazetteer")
+    assert backend.queries == ["중구"]
@@ -0,0 +1,43 @@
+import threading
+
+import pytest
+
+from llm_limiter import AdmissionController, LLMBusyError
+
+
+def test_waiting_users_take_turns():
+    # 하나뿐인 토큰을 먼저 써 버리고 줄을 세운 뒤, 초당 10개씩 통과하는 순서를 본다
+    limiter = AdmissionController(rate=10, burst=1, max_queue=10)
+    assert limiter.enter("x").granted.wait(5)
+    tickets = [(name, limiter.enter(name[0])) for name in ["a1", "a2", "a3", "b1", "c1", "b2"]]
+    assert [limiter.position(ticket) for _, ticket in tickets] == [1, 4, 6, 2, 3, 5]
+
+    granted = []
+    lock = threading.Lock()
+
+    def wait(name, ticket):
+        assert ticket.granted.wait(5)
+        with lock:
+            granted.append(name)
+
+    threads = [threading.Thread(target=wait, args=pair) for pair in tickets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert granted == ["a1", "b1", "c1", "a2", "b2", "a3"]
+    assert limiter.stats()["admitted"] == 7
+
+
+def test_full_queue_rejects():
+    limiter = AdmissionController(rate=0.01, burst=0, max_queue=2)
+    first = limiter.enter("a")
+    limiter.enter("b")
+    with pytest.raises(LLMBusyError):
+        limiter.enter("c")
+    assert limiter.stats()["rejected"] == 1
+
+    # 자리가 나면 다시 받는다
+    limiter.leave(first)
+    limiter.enter("c")
+    assert limiter.stats()["waiting"] == 2
@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from ratings import RatingRanker
+
+
+@pytest.fixture
+def clinics():
+    return pd.DataFrame({
+        "clinic_id": ["A", "B", "C", "D"],
+        "name": ["가 의원", "나 의원", "다 의원", "라 의원"],
+        "sido": ["서울특별시", "서울특별시", "서울특별시", "부산광역시"],
+        "sigungu": ["강남구", "강남구", "마포구", "해운대구"],
+    })
+
+
+@pytest.fixture
+def ranker(clinics, tmp_path):
+    ranker = RatingRanker(clinics, path=str(tmp_path / "ratings.sqlite3"), sample_path=None, top_k=3)
+    for clinic_id, ratings in {"A": [5, 5, 5, 5, 5, 4], "B": [5], "C": [2, 2], "D": [4, 4]}.items():
+        for rating in ratings:
+            ranker.add_rating(clinic_id, "tester", rating)
+    ranker.rebuild()
+    return ranker
+
+
+def ids(frame):
+    return list(frame["clinic_id"])
+
+
+def test_regions_are_ranked(ranker):
+    # 평가가 하나뿐인 B(5점)는 사전 평균 쪽으로 당겨져 평가가 많은 A(평균 4.8점) 보다 아래다
+    assert ids(ranker.top("서울특별시", "강남구")) == ["A", "B"]
+    assert ids(ranker.top("서울특별시")) == ["A", "B", "C"]
+    assert ids(ranker.top("부산광역시", "해운대구")) == ["D"]
+    assert ids(ranker.top("대구광역시")) == []
+
+
+def test_add_rating_reranks_only_its_regions(ranker):
+    for region in [("서울특별시", ""), ("서울특별시", "마포구"), ("부산광역시", "")]:
+        ranker.top(*region)
+    for _ in range(5):
+        ranker.add_rating("B", "tester", 5)
+
+    # B 가 속한 두 지역(시/도, 시/군/구) 목록만 다시 만들고, 다른 지역은 만들어 둔 결과를 그대로 쓴다
+    assert set(ranker._frames) == {("서울특별시", "마포구"), ("부산광역시", "")}
+    assert ids(ranker.top("서울특별시", "강남구")) == ["B", "A"]
+    assert ids(ranker.top("서울특별시")) == ["B", "A", "C"]
+    top = ranker.top("서울특별시", "강남구").iloc[0]
+    assert (top["ratings"], top["average"]) == (6, 5.0)
+
+
+def test_ratings_survive_restart(ranker, clinics, tmp_path):
+    ranker.add_rating("C", "tester", 5)
+    ranker.rebuild()
+    reopened = RatingRanker(clinics, path=str(tmp_path / "ratings.sqlite3"), sample_path=None, top_k=3)
+    assert reopened.stats() | {"rebuilt_at": 0} == ranker.stats() | {"rebuilt_at": 0}
+    assert reopened.stats()["ratings"] == 12
+    assert ids(reopened.top("서울특별시")) == ids(ranker.top("서울특별시"))
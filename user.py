@@ -1,17 +1,16 @@
 import streamlit as st
-from streamlit_option_menu import option_menu
+import os
+import time
+import uuid
 from datetime import datetime, timedelta
-import plotly.graph_objects as go
 import numpy as np
 import pandas as pd
 from PIL import Image
-import folium
-from geopy.geocoders import Nominatim
-from streamlit_folium import st_folium
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
-from openai import OpenAI
-from dotenv import load_dotenv
-import os
+from emotion_model import get_emotion_model, retry_emotion_model, classify_emotion, top_emotion, READY, LOADING, FAILED
+from emotion_timeline import get_emotion_timeline
+from reply_cache import ENABLED as REPLY_CACHE_ENABLED, get_reply_cache, reply_key
+from chat_store import get_chat_store
+from chat_metrics import get_chat_metrics
 
 # 사용자 임의 데이터-------------------------------------
 emotions = ['분노', '기쁨', '불안', '당황', '상처', '슬픔']
@@ -29,6 +28,9 @@ df_psych['우울점수'] = (
 ).round(1)
 df_psych = df_psych.sort_values('날짜').reset_index(drop=True)
 
+# 대시보드 감정 순서에 맞춘 분류 모델 레이블
+emotion_labels = ['angry', 'happy', 'anxious', 'embarrassed', 'hurt', 'sad']
+
 login_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
 current_time = datetime.now()
 usage_duration = current_time - login_time
@@ -36,6 +38,8 @@ usage_duration = current_time - login_time
 
 # 사용자 대시보드----------------------------------------------
 def my_dashboard():
+    import plotly.graph_objects as go
+
     st.subheader(f"{st.session_state.username}님의 심리 대시보드 💉")
     
     # KPI 카드 4개(총 사용시간, 오늘 우울점수, 최고 우울점수, 최근 로그인 날짜)
@@ -129,11 +133,17 @@ def my_dashboard():
     with col2:
         st.markdown(''' **🔯감정상태분석**''')
 
+        # 실제 대화 기록이 있는 날은 누적 감정 평균을, 없으면 임의 데이터를 보여준다
+        message_count, day_scores = get_emotion_timeline().day(st.session_state.username, login_date)
         selected_data = df_psych[df_psych['날짜'] == login_date]
-        if selected_data.empty:
+        if day_scores is None and selected_data.empty:
             st.warning("해당 날짜의 데이터가 없습니다.")
         else:
-            values = selected_data[emotions].values.flatten().tolist()
+            if day_scores is not None:
+                values = [round(day_scores[label] * 100, 1) for label in emotion_labels]
+                st.caption(f"대화 {message_count}건 기준")
+            else:
+                values = selected_data[emotions].values.flatten().tolist()
             fig_radar = go.Figure()
             fig_radar.add_trace(go.Scatterpolar(
                 r=values + [values[0]],
@@ -206,44 +216,107 @@ def my_dashboard():
         st.write("🎵 노래 - 아기상어")
 
 
-@st.cache_resource
-def load_emotion_model():
-    model_name = "Jinuuuu/KoELECTRA_fine_tunning_emotion"
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
-    model = AutoModelForSequenceClassification.from_pretrained(model_name)
-    return pipeline("text-classification", model=model, tokenizer=tokenizer, return_all_scores=True)
-
-emotion_classifier = load_emotion_model()
-
-# 레이블 매핑
-label_map = {
-    "angry": "분노",
-    "happy": "행복",
-    "anxious": "불안",
-    "embarrassed": "당황",
-    "sad": "슬픔",
-    "hurt": "상처"
-}
-
-# 감정 예측 함수
-def predict_emotion(text: str):
-    result = emotion_classifier(text)[0]
-    best = max(result, key=lambda x: x["score"])
-    emotion = label_map.get(best["label"], best["label"])
-    score = best["score"]
-    return emotion, score
-
 # -----------------------------
 # 챗봇 함수
 # -----------------------------
 
 
+# 스트리밍 중 말풍선을 다시 그리는 최소 간격(초)
+STREAM_PAINT_INTERVAL = 0.05
+# 화면에 한 번에 보여줄 메시지 수 / 세션에 남겨둘 메시지 수 (넘치면 세션에서 빼고 저장소에서 읽는다)
+CHAT_PAGE_SIZE = int(os.environ.get("CHAT_PAGE_SIZE", 30))
+CHAT_MEMORY_LIMIT = int(os.environ.get("CHAT_MEMORY_LIMIT", 100))
+
+# 💬 CSS 말풍선 스타일
+CHAT_CSS = """<style>
+    .message { max-width: 80%; padding: 10px 15px; border-radius: 20px; margin: 8px 0; display: inline-block; word-wrap: break-word; font-size: 16px; line-height: 1.4;}
+    .bot { background-color: #f1f0f0; text-align: left; }
+    .user { background-color: #dcf8c6; text-align: right; float: right; }
+    .clearfix::after { content: ""; display: table; clear: both; }
+</style>"""
+
+
+def message_html(role, message):
+    cls = "user" if role == "user" else "bot"
+    return f'<div class="clearfix"><div class="message {cls}">{message}</div></div>'
+
+
+def render_message(container, role, message):
+    container.markdown(message_html(role, message), unsafe_allow_html=True)
+
+
+def keeps_history():
+    # 회원만 대화를 저장하고 다시 이어 본다. 비회원은 모두 같은 계정(unuser)으로 들어오므로 남기지 않는다
+    return st.session_state.get("role") == "user"
+
+
+def add_message(role, message, scores=None):
+    # 세션 기록에 추가하고, 저장소에는 백그라운드로 쓴다 (사용자 메시지는 감정 점수 분포도 같이)
+    chat = {"role": role, "message": message, "ts": time.time()}
+    if scores is not None:
+        chat["scores"] = scores
+    st.session_state.chat_history.append(chat)
+    if keeps_history():
+        get_chat_store().append(st.session_state.username, st.session_state.conversation_id, chat)
+
+
+def render_transcript():
+    # 최근 메시지 N 개만, CSS 와 함께 요소 하나로 그린다 (메시지 수만큼 요소를 만들지 않는다)
+    history = st.session_state.chat_history
+    archived = st.session_state.chat_archived
+    visible = st.session_state.chat_visible
+    total = archived + len(history)
+
+    if total > visible:
+        if st.button(f"⬆️ 이전 대화 더 보기 ({total - visible}개)", key="chat_load_earlier"):
+            st.session_state.chat_visible += CHAT_PAGE_SIZE
+            st.rerun()
+
+    # 세션에서 뺀 메시지가 있고 그보다 더 거슬러 보려 하면 저장소에서 읽어 앞에 붙인다
+    recent = history[1:]
+    if visible <= len(recent):
+        messages = recent[-visible:]
+    elif not archived:
+        messages = history[-visible:]
+    else:
+        messages = get_chat_store().page(
+            st.session_state.username, st.session_state.conversation_id,
+            visible - len(recent), before=recent[0]["ts"]
+        ) + recent
+
+    st.markdown(
+        CHAT_CSS + "".join(message_html(chat["role"], chat["message"]) for chat in messages),
+        unsafe_allow_html=True
+    )
+
+
+def spill_history():
+    # 세션에 남은 메시지가 너무 많으면 오래된 것부터 세션에서 뺀다 (저장소에는 이미 있다)
+    history = st.session_state.chat_history
+    if len(history) <= CHAT_MEMORY_LIMIT:
+        return
+    spilled = st.session_state.chat_context.spill(history, CHAT_MEMORY_LIMIT)
+    # 비회원 대화는 저장소에 없으므로 세션에서 빠지면 더 거슬러 볼 수 없다
+    if keeps_history():
+        st.session_state.chat_archived += len(spilled)
+
+
+@st.fragment(run_every=2)
+def wait_for_model():
+    # 모델이 준비될 때까지 이 부분만 주기적으로 다시 그린다
+    if get_emotion_model().status == LOADING:
+        st.info("심린이가 대화할 준비를 하고 있어요... 잠시만 기다려 주세요 ⏳")
+    else:
+        st.rerun()
+
+
 def chat_bot():
-    load_dotenv()
-    api_key = st.secrets["OPENAI_API_KEY"]
+    from llm_client import get_openai_client
+    from chat_context import ConversationContext
+    from llm_limiter import LLMBusyError, get_llm_limiter
 
-# ✅ OpenAI 클라이언트 초기화
-    client = OpenAI(api_key=api_key)# 키 수정
+    # ✅ 모든 세션이 같이 쓰는 OpenAI 클라이언트 (연결 풀 재사용)
+    client = get_openai_client()
 
     col1, col2 = st.columns([1,10])
     with col2:
@@ -257,95 +330,188 @@ def chat_bot():
             st.warning("`츄러스미_2.png` 이미지를 찾을 수 없습니다.")
             st.write("📌 이미지 없음")
 
-    # 💬 CSS 말풍선 스타일
-    st.markdown("""
-        <style>
-            .message { max-width: 80%; padding: 10px 15px; border-radius: 20px; margin: 8px 0; display: inline-block; word-wrap: break-word; font-size: 16px; line-height: 1.4;}
-            .bot { background-color: #f1f0f0; text-align: left; }
-            .user { background-color: #dcf8c6; text-align: right; float: right; }
-            .clearfix::after { content: ""; display: table; clear: both; }
-        </style>
-    """, unsafe_allow_html=True)
-
     # 세션 초기화
     if "chat_history" not in st.session_state:
-        st.session_state.chat_history = [
-            {"role": "bot", "message": "안녕하세요! 필요한 도움이 있으신가요? 당신의 이야기를 들려주세요. 😊"}
-        ]
+        store = get_chat_store()
+        username = st.session_state.username
+        st.session_state.chat_context = ConversationContext()
+        st.session_state.chat_visible = CHAT_PAGE_SIZE
+
+        # 회원이 다시 접속하면 마지막 대화를 이어서 보여준다 (비회원은 언제나 새 대화)
+        conversation_id = store.latest_conversation(username) if keeps_history() else None
+        history = store.page(username, conversation_id, CHAT_MEMORY_LIMIT) if conversation_id else []
+        if history:
+            st.session_state.conversation_id = conversation_id
+            st.session_state.chat_history = history
+            st.session_state.chat_archived = store.count(username, conversation_id) - len(history)
+        else:
+            st.session_state.conversation_id = uuid.uuid4().hex
+            st.session_state.chat_history = []
+            st.session_state.chat_archived = 0
+            add_message("bot", "안녕하세요! 필요한 도움이 있으신가요? 당신의 이야기를 들려주세요. 😊")
+
+    # --- 감정 분석 모델 준비 상태 확인 ---
+    model = get_emotion_model()
+    if model.status == LOADING:
+        wait_for_model()
+    elif model.status == FAILED:
+        st.error(f"감정 분석 모델을 불러오지 못했습니다. 오류: {model.error}")
+        if st.button("🔄 다시 시도", key="retry_emotion_model"):
+            retry_emotion_model()
+            st.rerun()
 
     # --- 사용자 입력 받기 ---
-    user_input = st.chat_input("💬 오늘 기분은 어땠나요? (예: 오늘 너무 속상했어...)")
+    user_input = st.chat_input(
+        "💬 오늘 기분은 어땠나요? (예: 오늘 너무 속상했어...)",
+        disabled=model.status != READY
+    )
 
-    if user_input:
-        # 1️⃣ 사용자 메시지 바로 추가
-        st.session_state.chat_history.append({"role": "user", "message": user_input})
-
-        with st.spinner("당신의 감정을 분석하고 상담사 연결 중... 🧘‍♀️"):
-            try:
-                # 2️⃣ 감정분류 (문자 레이블 처리)
-                result = emotion_classifier(user_input)[0]
-                best = max(result, key=lambda x: x["score"])
-                label_map = {
-                    "angry": "분노",
-                    "happy": "행복",
-                    "anxious": "불안",
-                    "embarrassed": "당황",
-                    "sad": "슬픔",
-                    "hurt": "상처"
-                }
-                emotion = label_map.get(best["label"], best["label"])
-                score = best["score"]
-
-                # 3️⃣ GPT 프롬프트 구성
-                prompt = f"""
-                당신은 친절하고 경험 많은 심리상담사야.
-                사용자가 입력한 문장: "{user_input}"
-                감정 분석 결과: {emotion} (신뢰도: {score:.2f})
-
-                - 먼저 사용자의 감정을 충분히 공감하고 이해를 표현해줘.
-                - 상황을 개선할 수 있는 현실적 조언이나 방법 2-3가지 제안.
-                - 감정 분석 신뢰도가 0.6 미만이면 자연스럽게 되묻기.
-                - 말투는 친근하고 따뜻하게 작성.
-                """
-
-                # 4️⃣ GPT 응답 생성
-                response = client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": "너는 따뜻한 심리상담사이다. 사용자의 감정을 공감하고 현실적인 조언을 제공해줘."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.7
-                )
-                answer = response.choices[0].message.content
+    # --- 대화 렌더링 (최근 메시지만) ---
+    metrics = get_chat_metrics()
+    with metrics.span("render"):
+        render_transcript()
 
-                # 5️⃣ 챗봇 답변 추가
-                st.session_state.chat_history.append({"role": "bot", "message": answer})
+    if user_input:
+        started = time.perf_counter()
+        # 1️⃣ 사용자 메시지 바로 표시 (기록에는 감정 점수와 함께 추가)
+        render_message(st, "user", user_input)
+        reply = st.empty()
+        queue_status = st.empty()
 
-            except Exception as e:
-                st.error(f"상담사 연결에 실패했습니다. 오류: {e}")
+        try:
+            with st.spinner("당신의 감정을 분석하고 상담사 연결 중... 🧘‍♀️"):
+                # 2️⃣ 감정분류 (문자 레이블 처리) 후 대화별 감정 기록에 누적
+                # (집계를 먼저 갱신한다: 처음 찾는 사용자는 저장소에서 집계를 만드는데, 이번 메시지가 두 번 세어지지 않게)
+                with metrics.span("classify"):
+                    scores = classify_emotion(user_input, long_input=True)
+                    emotion, score = top_emotion(scores)
+                    get_emotion_timeline().record(st.session_state.username, st.session_state.conversation_id, scores)
+                add_message("user", user_input, scores)
+
+                # 같은 입력/감정/신뢰도 구간에 저장된 답변이 있으면 바로 쓴다 (REPLY_CACHE_ENABLED=1 일 때)
+                # 이전 대화(요약, 최근 턴)가 프롬프트에 들어가는 답변은 다른 사용자에게 보일 수 있으므로 캐시하지 않는다
+                shareable = not st.session_state.chat_context.has_context(st.session_state.chat_history)
+                cache_key = reply_key(user_input, emotion, score) if REPLY_CACHE_ENABLED and shareable else None
+                cached_answer = get_reply_cache().get(cache_key) if cache_key else None
+
+            if cached_answer is not None:
+                render_message(reply, "bot", cached_answer)
+                add_message("bot", cached_answer)
+                spill_history()
+                metrics.observe("total", time.perf_counter() - started)
+                return
+
+            with st.spinner("상담사가 답변을 준비하고 있어요... 🧘‍♀️"):
+                # 3️⃣ GPT 프롬프트 구성 (고정 지시문 + 이전 대화 요약 + 최근 대화 + 이번 메시지, 토큰 예산 안에서)
+                with metrics.span("prompt"):
+                    prompt = f"""사용자가 입력한 문장: "{user_input}"
+감정 분석 결과: {emotion} (신뢰도: {score:.2f})"""
+                    messages = st.session_state.chat_context.build_messages(st.session_state.chat_history, prompt)
+
+                # 4️⃣ GPT 응답 생성 (토큰 단위 스트리밍, 전체 호출량 제한을 통과한 뒤)
+                def show_queue(position):
+                    queue_status.info(f"⏳ 지금 상담 요청이 많아요. 대기 순번 {position}번입니다.")
+
+                llm_started = time.perf_counter()
+                response = get_llm_limiter().call(
+                    st.session_state.username,
+                    client,
+                    lambda client: client.chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=messages,
+                        temperature=0.7,
+                        stream=True
+                    ),
+                    on_wait=show_queue
+                )
+                queue_status.empty()
+
+            # 생성되는 대로 말풍선에 이어 붙인다 (대기열 + 첫 토큰까지 / 나머지 스트리밍을 따로 잰다)
+            answer = ""
+            last_paint = 0.0
+            stream_started = None
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                if stream_started is None:
+                    stream_started = time.perf_counter()
+                    metrics.observe("llm_wait", stream_started - llm_started)
+                answer += chunk.choices[0].delta.content or ""
+                if time.monotonic() - last_paint >= STREAM_PAINT_INTERVAL:
+                    render_message(reply, "bot", answer + " ▌")
+                    last_paint = time.monotonic()
+            render_message(reply, "bot", answer)
+            if stream_started is not None:
+                metrics.observe("llm_stream", time.perf_counter() - stream_started)
+
+            # 5️⃣ 답변이 다 만들어진 뒤에만 대화 기록에 추가
+            add_message("bot", answer)
+            if cache_key and answer:
+                get_reply_cache().put(cache_key, answer)
+            # 최근 K 턴 밖으로 밀려난 대화는 백그라운드에서 요약에 합친다
+            st.session_state.chat_context.maybe_summarize(client, st.session_state.chat_history, st.session_state.username)
+            spill_history()
+            metrics.observe("total", time.perf_counter() - started)
+
+        except LLMBusyError as e:
+            reply.empty()
+            queue_status.empty()
+            st.warning(f"🙏 {e}")
+        except Exception as e:
+            reply.empty()
+            queue_status.empty()
+            st.error(f"상담사 연결에 실패했습니다. 오류: {e}")
+
+# 병원추천 페이지에 보여줄 가까운 병원 수
+HOSPITAL_NEAREST_K = int(os.environ.get("HOSPITAL_NEAREST_K", 10))
+
+
+def choose_location(name):
+    st.session_state.hospital_location = name
 
-    # --- 대화 렌더링 ---
-    for chat in st.session_state.chat_history:
-        cls = "user" if chat["role"] == "user" else "bot"
-        st.markdown(f'<div class="clearfix"><div class="message {cls}">{chat["message"]}</div></div>', unsafe_allow_html=True)
 
 def hospital():
+    # 지도 관련 라이브러리는 병원추천 페이지를 열 때만 import
+    import folium
+    from geocoder import get_geocoder
+    from gazetteer import get_gazetteer
+    from clinics import get_clinic_index, using_sample_data
+    from clinic_map import get_clinic_map
+    from ratings import get_rating_ranker
+
     st.title("🏥심린이 병원추천")
+    if using_sample_data():
+        st.warning("⚠️ 지금 보이는 병원 목록과 평점은 화면 구성을 보여 주기 위한 가상 예시 데이터입니다. 실제 병원 정보가 아닙니다.")
 
     # 기본 위치: 서울 시청
     default_lat, default_lon = 37.5665, 126.9780
 
     # 사용자 위치 입력
-    user_location = st.text_input("📍 현재 위치를 입력하세요 (예: 서울시 강남구 역삼동)")
-
-    # 지도 초기화
-    m = folium.Map(location=[default_lat, default_lon], zoom_start=13)
+    user_location = st.text_input("📍 현재 위치를 입력하세요 (예: 서울시 강남구 역삼동)", key="hospital_location")
+
+    # 행정구역 이름이 덜 입력됐으면 지명 사전에서 이어질 이름을 추천한다
+    gazetteer = get_gazetteer()
+    if user_location and gazetteer.lookup(user_location) is None:
+        suggestions = gazetteer.suggest(user_location, limit=5)
+        if suggestions:
+            st.caption("혹시 이 지역인가요?")
+            for col, place in zip(st.columns(len(suggestions)), suggestions):
+                col.button(place.name, key=f"suggest_{place.name}", on_click=choose_location, args=(place.name,))
+
+    # 지도 초기화: 기본 지도는 캐시에서 꺼내고, 이번 실행에서 바뀌는 마커만 이 레이어에 담는다
+    center, zoom = (default_lat, default_lon), 13
+    layer = folium.FeatureGroup(name="내 위치")
+    nearby = None
 
     # 사용자 위치 입력 시 처리
     if user_location:
-        geolocator = Nominatim(user_agent="myGeocoder")
-        location = geolocator.geocode(user_location)
+        # 같은 주소는 캐시에서 바로 찾고, 외부 지오코더는 초당 1건으로 제한된다
+        location, geocode_failed = None, False
+        try:
+            location = get_geocoder().geocode(user_location)
+        except Exception as e:
+            geocode_failed = True
+            st.error(f"위치 검색 서비스에 연결하지 못했습니다. 오류: {e}")
 
         if location:
             lat, lon = location.latitude, location.longitude
@@ -353,26 +519,21 @@ def hospital():
             # 내 위치 마커
             folium.Marker(
                 [lat, lon], tooltip="내 위치", icon=folium.Icon(color="blue")
-            ).add_to(m)
+            ).add_to(layer)
 
-            # 병원 예시 마커 (임의 좌표, 실제 데이터로 바꿀 수 있음)
-            folium.Marker(
-                [lat + 0.001, lon + 0.001],
-                tooltip="힐링 정신건강의학과의원",
-                icon=folium.Icon(color="green")
-            ).add_to(m)
-
-            folium.Marker(
-                [lat - 0.001, lon - 0.001],
-                tooltip="마음숲 클리닉",
-                icon=folium.Icon(color="green")
-            ).add_to(m)
+            # 가까운 병원 k 곳 (프로세스당 한 번 만든 격자 인덱스에서 찾는다)
+            nearby = get_clinic_index().nearest(lat, lon, k=HOSPITAL_NEAREST_K)
+            for clinic in nearby.itertuples():
+                folium.Marker(
+                    [clinic.latitude, clinic.longitude],
+                    tooltip=f"{clinic.name} ({clinic.distance_km:.1f}km)",
+                    icon=folium.Icon(color="green")
+                ).add_to(layer)
 
             # 중심을 사용자 위치로 이동
-            m.location = [lat, lon]
-            m.zoom_start = 15
+            center, zoom = (lat, lon), 15
 
-        else:
+        elif not geocode_failed:
             st.error("❌ 위치를 찾을 수 없습니다. 다시 입력해 주세요.")
     else:
         st.info("📌 위치를 입력하면 주변 병원이 지도에 표시됩니다.")
@@ -380,12 +541,43 @@ def hospital():
     # 지도 표시
     col1, col2, col3 = st.columns([2,1,1])
     with col1:
-        st_folium(m, width=700, height=450)
+        get_clinic_map().show(*center, zoom, layer)
 
     with col2:
         st.text("거리기반")
+        if nearby is not None:
+            for rank, clinic in enumerate(nearby.itertuples(), start=1):
+                phone = f" · {clinic.phone}" if clinic.phone else ""
+                st.markdown(f"**{rank}. {clinic.name}**  \n{clinic.distance_km:.1f}km{phone}")
     with col3:
         st.text("평점기반")
+        if nearby is not None and len(nearby):
+            # 입력한 시/군/구나 시/도(모르면 가장 가까운 병원이 있는 시/군/구)의 평점 상위 목록. 미리 만들어 둔 목록을 꺼내기만 한다
+            ranker = get_rating_ranker()
+            region = location.address.split(" ") if location.source == "gazetteer" else []
+            if len(region) >= 2:
+                sido, sigungu = region[:2]
+            elif len(region) == 1:
+                sido, sigungu = region[0], ""
+            else:
+                sido, sigungu = nearby.iloc[0]["sido"], nearby.iloc[0]["sigungu"]
+            st.caption(f"{sido} {sigungu}".strip())
+            ranked = ranker.top(sido, sigungu)
+            if ranked.empty:
+                st.info("아직 이 지역 병원 평가가 없습니다.")
+            for rank, clinic in enumerate(ranked.itertuples(), start=1):
+                st.markdown(f"**{rank}. {clinic.name}**  \n⭐ {clinic.average:.1f} ({clinic.ratings}명)")
+
+            with st.expander("⭐ 병원 평가 남기기"):
+                with st.form("rate_clinic", clear_on_submit=True):
+                    clinic_id = st.selectbox(
+                        "병원", nearby["clinic_id"].tolist(),
+                        format_func=dict(zip(nearby["clinic_id"], nearby["name"])).get
+                    )
+                    rating = st.slider("별점", 1, 5, 5)
+                    if st.form_submit_button("평가하기"):
+                        ranker.add_rating(clinic_id, st.session_state.username, rating)
+                        st.success("평가해 주셔서 고마워요!")
 
 def content():
     st.subheader("🎬 심린이 추천 콘텐츠")